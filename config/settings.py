@@ -31,6 +31,14 @@ class Settings(BaseSettings):
         default="sqlite:///data/ktrade.db",
         description="Database connection URL"
     )
+    db_pool_size: int = Field(
+        default=10,
+        description="Persistent connections kept in the pool (non-SQLite databases)"
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        description="Extra connections allowed beyond the pool size (non-SQLite databases)"
+    )
 
     # Bot Configuration
     bot_mode: str = Field(default="paper", description="Bot mode: paper or live")
@@ -22,7 +22,7 @@ from config.settings import settings
 from src.database.session import SessionLocal
 from src.database.models import (
     Position, Trade, PortfolioSnapshot,
-    PositionStatus, TradeSide
+    PositionStatus, PositionStats, TradeSide
 )
 
 
@@ -203,6 +203,9 @@ def backfill_orders_and_trades(trading_client, db):
 
                     current_position = None
 
+        # Positions were closed outside the order executor; drop the running
+        # stats so they are reseeded from the positions table on next use
+        db.query(PositionStats).delete()
         db.commit()
         print(f"Created {positions_created} positions and {trades_created} trades")
         return positions_created, trades_created
@@ -23,6 +23,12 @@ def migrate():
     # SQLAlchemy's create_all() only creates tables that don't already exist
     Base.metadata.create_all(bind=engine)
 
+    # create_all() skips indexes on tables that already exist, so add any
+    # newly declared ones explicitly
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
     print("Migration complete!")
 
     # Print table names
@@ -56,6 +56,33 @@ def handle_rate_limit(func):
     return wrapper
 
 
+def _to_timeframe(timeframe: str) -> TimeFrame:
+    """Map a timeframe string to the TimeFrame enum"""
+    if timeframe == "1Min":
+        return TimeFrame.Minute
+    elif timeframe == "5Min":
+        # Note: For 5Min need to aggregate client-side or use different approach
+        return TimeFrame.Minute
+    elif timeframe == "15Min":
+        # Note: For 15Min need to aggregate client-side or use different approach
+        return TimeFrame.Minute
+    elif timeframe == "1Hour":
+        return TimeFrame.Hour
+    return TimeFrame.Day
+
+
+def _bar_to_dict(bar) -> Dict[str, Any]:
+    """Convert an Alpaca bar to a plain dict"""
+    return {
+        "timestamp": bar.timestamp,
+        "open": float(bar.open),
+        "high": float(bar.high),
+        "low": float(bar.low),
+        "close": float(bar.close),
+        "volume": float(bar.volume),
+    }
+
+
 class AlpacaClient:
     """
     Wrapper around Alpaca API with retry logic and error handling.
@@ -667,21 +694,7 @@ class AlpacaClient:
             if not end:
                 end = datetime.now()
 
-            # Map timeframe string to TimeFrame enum
-            if timeframe == "1Min":
-                tf = TimeFrame.Minute
-            elif timeframe == "5Min":
-                tf = TimeFrame.Minute
-                # Note: For 5Min need to aggregate client-side or use different approach
-            elif timeframe == "15Min":
-                tf = TimeFrame.Minute
-                # Note: For 15Min need to aggregate client-side or use different approach
-            elif timeframe == "1Hour":
-                tf = TimeFrame.Hour
-            elif timeframe == "1Day":
-                tf = TimeFrame.Day
-            else:
-                tf = TimeFrame.Day
+            tf = _to_timeframe(timeframe)
 
             if is_crypto:
                 request = CryptoBarsRequest(
@@ -705,17 +718,7 @@ class AlpacaClient:
 
             # Extract data
             if symbol in bars.data:
-                return [
-                    {
-                        "timestamp": bar.timestamp,
-                        "open": float(bar.open),
-                        "high": float(bar.high),
-                        "low": float(bar.low),
-                        "close": float(bar.close),
-                        "volume": float(bar.volume),
-                    }
-                    for bar in bars.data[symbol]
-                ]
+                return [_bar_to_dict(bar) for bar in bars.data[symbol]]
             return []
 
         except Exception as e:
@@ -727,6 +730,79 @@ class AlpacaClient:
             )
             raise
 
+    @handle_rate_limit
+    def get_bars_multi(
+        self,
+        symbols: List[str],
+        timeframe: str = "1Day",
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100,
+        sleep_time: float = 0.0
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get historical bar data for several symbols with one request per
+        asset class (stocks, crypto) instead of one per symbol.
+
+        Args:
+            symbols: Stock and/or crypto symbols
+            timeframe: Bar timeframe (e.g., '1Min', '1Hour', '1Day')
+            start: Start datetime
+            end: End datetime
+            limit: Number of most recent bars to keep per symbol
+            sleep_time: Seconds to wait between the stock and crypto requests
+
+        Returns:
+            Dict of symbol -> list of bar data (same shape as get_bars)
+        """
+        try:
+            if not start:
+                start = datetime.now() - timedelta(days=120)
+            if not end:
+                end = datetime.now()
+
+            tf = _to_timeframe(timeframe)
+            stocks = [s for s in symbols if "/" not in s]
+            cryptos = [s for s in symbols if "/" in s]
+
+            # The API's limit caps the total across all symbols, so fetch the
+            # date range unbounded and keep each symbol's newest bars below
+            responses = []
+            if stocks:
+                request = StockBarsRequest(
+                    symbol_or_symbols=stocks,
+                    timeframe=tf,
+                    start=start,
+                    end=end,
+                    feed=DataFeed.IEX  # Use IEX for free tier compatibility
+                )
+                responses.append(self.stock_data_client.get_stock_bars(request))
+            if cryptos:
+                if responses and sleep_time > 0:
+                    time.sleep(sleep_time)
+                request = CryptoBarsRequest(
+                    symbol_or_symbols=cryptos,
+                    timeframe=tf,
+                    start=start,
+                    end=end
+                )
+                responses.append(self.crypto_data_client.get_crypto_bars(request))
+
+            result = {symbol: [] for symbol in symbols}
+            for bars in responses:
+                for symbol, symbol_bars in bars.data.items():
+                    result[symbol] = [_bar_to_dict(bar) for bar in symbol_bars[-limit:]]
+            return result
+
+        except Exception as e:
+            logger.error(
+                "failed_to_get_bars_multi",
+                symbols=symbols,
+                timeframe=timeframe,
+                error=str(e)
+            )
+            raise
+
     def get_latest_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get latest quote for a symbol.
@@ -12,7 +12,7 @@ from src.backtest.data import HistoricalDataFetcher
 from src.backtest.portfolio import SimulatedPortfolio
 from src.backtest.metrics import calculate_metrics, PerformanceMetrics, generate_report
 from src.strategies.base import BaseStrategy
-from src.data.indicators import calculate_all_indicators, get_latest_indicators
+from src.data.indicators import calculate_all_indicators_batch, get_latest_indicators
 from config.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -90,13 +90,14 @@ class Backtester:
             timeframe=timeframe
         )
 
-        # Add indicators to each dataset
-        for symbol, df in self._historical_data.items():
-            if len(df) >= 50:
-                # Convert to format expected by calculate_all_indicators
-                bars = df.to_dict('records')
-                df_with_indicators = calculate_all_indicators(bars)
-                self._historical_data[symbol] = df_with_indicators
+        # Add indicators to each dataset (symbols are calculated concurrently)
+        bars_by_symbol = {
+            # Convert to format expected by calculate_all_indicators
+            symbol: df.to_dict('records')
+            for symbol, df in self._historical_data.items()
+            if len(df) >= 50
+        }
+        self._historical_data.update(calculate_all_indicators_batch(bars_by_symbol))
 
         logger.info(
             "backtest_data_loaded",
@@ -3,7 +3,7 @@ Simulated portfolio for backtesting.
 Tracks positions, cash, and trade history.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 import structlog
@@ -113,9 +113,9 @@ class SimulatedPortfolio:
         """Check if we have a position in symbol."""
         return symbol in self.positions
 
-    def get_owned_symbols(self) -> List[str]:
-        """Get list of symbols we own."""
-        return list(self.positions.keys())
+    def get_owned_symbols(self) -> FrozenSet[str]:
+        """Get the set of symbols we own (a snapshot, for fast membership checks)."""
+        return frozenset(self.positions)
 
     def positions_value(self, current_prices: Dict[str, float]) -> float:
         """Calculate total value of all positions."""
@@ -4,13 +4,14 @@ Handles trade execution and position tracking in the database.
 """
 
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 import structlog
 from sqlalchemy.orm import Session
 
 from src.api.alpaca_client import alpaca_client
 from src.database.models import Position, Trade, Signal, PositionStatus, TradeSide, SignalType
 from src.core.risk_manager import risk_manager
+from src.core.portfolio import portfolio_tracker
 from config.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -124,6 +125,10 @@ class OrderExecutor:
             filled_price = order_status.get('filled_avg_price') or current_price
             filled_qty = order_status.get('filled_qty', quantity)
 
+            # Single timestamp for every record written in this transaction
+            # (naive UTC, matching the model column defaults)
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+
             # Calculate stop loss for tracking (trailing stop will handle exit)
             stop_loss = filled_price * (1 - settings.trailing_stop_pct / 100)
 
@@ -175,7 +180,7 @@ class OrderExecutor:
                 platform="alpaca",
                 quantity=filled_qty,
                 entry_price=filled_price,
-                entry_date=datetime.utcnow(),
+                entry_date=now,
                 strategy=signal.strategy,
                 confidence_score=confidence,
                 stop_loss=stop_loss,
@@ -195,7 +200,7 @@ class OrderExecutor:
                 side=TradeSide.BUY,
                 quantity=filled_qty,
                 price=filled_price,
-                filled_at=datetime.utcnow(),
+                filled_at=now,
                 alpaca_order_id=str(order['id'])
             )
 
@@ -205,7 +210,7 @@ class OrderExecutor:
             db_signal = db.query(Signal).filter(Signal.id == signal.id).first()
             if db_signal:
                 db_signal.executed = True
-                db_signal.execution_time = datetime.utcnow()
+                db_signal.execution_time = now
                 db_signal.position_id = position.id
 
             db.commit()
@@ -302,9 +307,17 @@ class OrderExecutor:
             filled_price = order_status.get('filled_avg_price') or current_price
             filled_qty = order_status.get('filled_qty', position.quantity)
 
+            # Single timestamp for every record written in this transaction
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+            # Update running stats before the position is marked closed.
+            # filled_qty is 0 while the order is still pending, so use the
+            # position's quantity (the same figure the stats are seeded from)
+            portfolio_tracker.record_closed_position(position, filled_price, position.quantity, db)
+
             # Update position
             position.exit_price = filled_price
-            position.exit_date = datetime.utcnow()
+            position.exit_date = now
             position.status = PositionStatus.CLOSED
             position.notes = reason
 
@@ -315,7 +328,7 @@ class OrderExecutor:
                 side=TradeSide.SELL,
                 quantity=filled_qty,
                 price=filled_price,
-                filled_at=datetime.utcnow(),
+                filled_at=now,
                 alpaca_order_id=str(order['id']),
                 notes=reason
             )
@@ -369,6 +382,7 @@ class OrderExecutor:
             ).all()
 
             # Close positions that are no longer in Alpaca
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
             for position in db_positions:
                 if position.symbol not in alpaca_symbols:
                     logger.warning(
@@ -377,8 +391,9 @@ class OrderExecutor:
                         symbol=position.symbol
                     )
                     # Mark as closed (may have been manually closed)
+                    portfolio_tracker.record_closed_position(position, None, position.quantity, db)
                     position.status = PositionStatus.CLOSED
-                    position.exit_date = datetime.utcnow()
+                    position.exit_date = now
                     position.notes = "Closed (not found in Alpaca)"
 
             db.commit()
@@ -6,10 +6,13 @@ Maintains portfolio snapshots and calculates performance metrics.
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.api.alpaca_client import alpaca_client
-from src.database.models import Position, PortfolioSnapshot, PositionStatus
+from src.database.models import Position, PortfolioSnapshot, PositionStatus, PositionStats
+from src.database.session import SessionLocal
 from config.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -176,17 +179,12 @@ class PortfolioTracker:
             open_positions = db.query(Position).filter(
                 Position.status == PositionStatus.OPEN
             ).count()
-            closed_positions = db.query(Position).filter(
-                Position.status == PositionStatus.CLOSED
-            ).count()
-
-            # Calculate win rate
-            winning_positions = db.query(Position).filter(
-                Position.status == PositionStatus.CLOSED,
-                Position.exit_price > Position.entry_price
-            ).count()
 
-            win_rate = (winning_positions / closed_positions * 100) if closed_positions > 0 else 0
+            # Closed/winning counts are maintained on position close
+            stats = self.get_position_stats(db)
+            closed_positions = stats.closed_positions
+            winning_positions = stats.winning_positions
+            win_rate = stats.win_rate_pct
 
             return {
                 "period_days": days,
@@ -199,12 +197,97 @@ class PortfolioTracker:
                 "closed_positions": closed_positions,
                 "winning_positions": winning_positions,
                 "win_rate_pct": win_rate,
+                "realized_pnl": stats.realized_pnl,
             }
 
         except Exception as e:
             logger.error("failed_to_get_performance_summary", error=str(e))
             return {}
 
+    def get_position_stats(self, db: Session) -> PositionStats:
+        """
+        Get the closed-position stats row, seeding it from the positions
+        table on first use.
+
+        Args:
+            db: Database session
+
+        Returns:
+            PositionStats row (attached to the session)
+        """
+        stats = db.get(PositionStats, 1)
+        if stats is None:
+            self._seed_position_stats()
+            stats = db.get(PositionStats, 1)
+        return stats
+
+    def _seed_position_stats(self) -> None:
+        """
+        Create the stats row from the closed positions.
+        Runs in its own session and commits, so the row survives callers
+        that never commit and isn't tied to their transaction. If another
+        process seeds first, the duplicate insert is discarded.
+        """
+        db = SessionLocal()
+        try:
+            closed, winning, realized = db.query(
+                func.count(Position.id),
+                func.count(Position.id).filter(Position.exit_price > Position.entry_price),
+                func.coalesce(
+                    func.sum((Position.exit_price - Position.entry_price) * Position.quantity),
+                    0.0
+                )
+            ).filter(Position.status == PositionStatus.CLOSED).one()
+
+            db.add(PositionStats(
+                id=1,
+                closed_positions=closed,
+                winning_positions=winning,
+                realized_pnl=float(realized)
+            ))
+            db.commit()
+
+            logger.info("position_stats_seeded", closed=closed, winning=winning)
+
+        except IntegrityError:
+            db.rollback()
+            logger.debug("position_stats_already_seeded")
+
+        finally:
+            db.close()
+
+    def record_closed_position(
+        self,
+        position: Position,
+        exit_price: Optional[float],
+        quantity: float,
+        db: Session
+    ) -> None:
+        """
+        Add a position close to the running stats.
+        Must be called before the position is marked closed, inside the
+        transaction that closes it; the caller commits.
+
+        Args:
+            position: Position being closed
+            exit_price: Fill price of the exit (None if unknown)
+            quantity: Position quantity (the figure the seed sums, so the
+                row matches a reseed even if the order hasn't filled yet)
+            db: Database session
+        """
+        # Increment in SQL so concurrent closes can't overwrite each other
+        values = {'closed_positions': PositionStats.closed_positions + 1}
+        if exit_price is not None:
+            if exit_price > position.entry_price:
+                values['winning_positions'] = PositionStats.winning_positions + 1
+            values['realized_pnl'] = (
+                PositionStats.realized_pnl + (exit_price - position.entry_price) * quantity
+            )
+
+        # Seed before writing (this position isn't closed yet, so it isn't counted)
+        self.get_position_stats(db)
+        db.execute(update(PositionStats).where(PositionStats.id == 1).values(**values))
+
 
 # Global portfolio tracker instance
 portfolio_tracker = PortfolioTracker()
@@ -4,40 +4,32 @@ Displays portfolio performance, positions, trades, and metrics.
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 import sys
 import os
+import threading
+import time
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.dashboard.data_loader import (
-    get_portfolio_summary,
-    get_positions,
-    get_recent_trades,
-    get_equity_curve,
-    get_backtest_results,
-    get_performance_metrics,
-    is_market_open,
-    get_wsb_trending,
-    get_stocktwits_trending,
-    get_symbol_sentiment,
-    get_market_mood,
-    get_news_sentiment,
-    get_news_headlines,
-    get_market_news_sentiment,
-    get_watchlist_news_sentiment,
-    get_rate_limit_status,
-    get_current_signals,
-    get_strategy_performance,
-    get_risk_metrics,
-    get_watchlist_data,
-)
+from src.utils.logger import setup_logging
+
+
+@st.cache_resource(show_spinner=False)
+def _init_logging() -> None:
+    """Configure logging once per server process; writes go through a queue thread."""
+    setup_logging(queued=True)
+
+
+_init_logging()
+
+from src.dashboard import data_loader as dl
 
 # Page config
 st.set_page_config(
@@ -56,6 +48,21 @@ st.markdown("""
         padding: 15px;
         margin: 5px 0;
     }
+    .metric-row {
+        display: grid;
+        gap: 10px;
+        margin-bottom: 10px;
+    }
+    .metric-row .metric-card { margin: 0; }
+    .metric-card h4 {
+        font-size: 0.85rem;
+        font-weight: 400;
+        opacity: 0.7;
+        margin: 0;
+        padding: 0;
+    }
+    .metric-card .metric-value { font-size: 1.6rem; }
+    .metric-card .metric-delta { font-size: 0.9rem; }
     .positive { color: #00c853; }
     .negative { color: #ff5252; }
     .stMetric > div { background-color: transparent; }
@@ -77,11 +84,176 @@ def format_pct(value: float) -> str:
     return f"{value:.2f}%"
 
 
+def format_currency_arr(values) -> np.ndarray:
+    """
+    Vectorized format_currency for table columns.
+    Scalar format_currency stays for single st.metric values.
+    """
+    values = np.asarray(values, dtype=float)
+    body = pd.Series(np.abs(values)).map('{:,.2f}'.format).to_numpy(dtype=str)
+    return np.char.add(np.where(values >= 0, '$', '-$'), body)
+
+
+def format_pct_arr(values) -> np.ndarray:
+    """Vectorized format_pct for table columns."""
+    values = np.asarray(values, dtype=float)
+    return pd.Series(values).map('{:+.2f}%'.format).to_numpy(dtype=str)
+
+
 def color_pct(value: float) -> str:
     """Return color based on positive/negative."""
     return "green" if value >= 0 else "red"
 
 
+def render_metric_row(cards: list, columns: int) -> None:
+    """
+    Render metric cards as one HTML block instead of one st.metric per card.
+    Each card is (label, value, delta); delta is None or a signed string
+    such as format_pct output, colored by its sign.
+    """
+    html = []
+    for label, value, delta in cards:
+        # st.markdown reads paired "$" as LaTeX delimiters
+        value = str(value).replace('$', '&#36;')
+        delta_html = ''
+        if delta is not None:
+            css = 'negative' if str(delta).startswith('-') else 'positive'
+            delta_html = f"<div class='metric-delta {css}'>{delta}</div>"
+        html.append(
+            f"<div class='metric-card'><h4>{label}</h4>"
+            f"<div class='metric-value'>{value}</div>{delta_html}</div>"
+        )
+    st.markdown(
+        f"<div class='metric-row' style='grid-template-columns: repeat({columns}, 1fr)'>"
+        + ''.join(html) + "</div>",
+        unsafe_allow_html=True,
+    )
+
+
+@dataclass
+class DashCache:
+    """
+    Per-session dashboard data that is only fetched on demand.
+    Stored under one session-state key; replacing it invalidates everything.
+    """
+    market_news: Optional[dict] = None
+    watchlist_sentiment: Optional[list] = None
+    symbol_sentiment: Optional[tuple] = None  # (symbol, sentiment)
+    signals: Optional[pd.DataFrame] = None
+    watchlist: Optional[list] = None
+
+
+def _cache() -> DashCache:
+    """Get this session's DashCache, creating it on first use."""
+    if '_dc' not in st.session_state:
+        st.session_state['_dc'] = DashCache()
+    return st.session_state['_dc']
+
+
+def _load_concurrently(**loaders) -> dict:
+    """
+    dl.load_concurrently for the cached shims below: each pool thread gets
+    this run's script context, so st.cache_data behaves as it does on the
+    script thread.
+    """
+    ctx = get_script_run_ctx()
+
+    def with_ctx(fn):
+        def run():
+            add_script_run_ctx(threading.current_thread(), ctx)
+            return fn()
+        return run
+
+    return dl.load_concurrently(**{name: with_ctx(fn) for name, fn in loaders.items()})
+
+
+# Cached loader shims. Streamlit reruns the whole script on every widget
+# interaction; these keep reruns from repeating DB/API/file work.
+# TTLs: 30-60s for live account data, 15 min for sentiment (Alpha Vantage
+# allows only 25 requests a day).
+# data_loader imports its sentiment providers on first use, so sessions that
+# never open the sentiment panel don't load them.
+@st.cache_data(ttl=30)
+def _portfolio() -> dict:
+    return dl.get_portfolio_summary()
+
+
+@st.cache_data(ttl=30)
+def _positions() -> dict:
+    return dl.to_columns(dl.get_positions(), dl.POSITION_COLUMNS)
+
+
+@st.cache_data(ttl=30)
+def _risk() -> dict:
+    return dl.get_risk_metrics()
+
+
+# The equity curve and performance metrics are not wrapped here:
+# data_loader already caches them per backtest file version, and a second
+# time-based layer would only delay new versions.
+
+
+@st.cache_data(ttl=60)
+def _strategy_performance() -> pd.DataFrame:
+    perf_df = pd.DataFrame.from_dict(dl.get_strategy_performance(), orient='index')
+    if not perf_df.empty:
+        perf_df['progress'] = np.minimum(1.0, perf_df['pct_of_trades'].to_numpy() / 100)
+    return perf_df
+
+
+@st.cache_data(max_entries=4)
+def _backtest_files_at(data_dir_mtime: float) -> list:
+    # Keyed on the data dir's mtime, which changes when files are added or removed
+    return dl.get_backtest_results()
+
+
+def _backtest_files() -> list:
+    data_dir = Path("data")
+    if not data_dir.exists():
+        return []
+    return _backtest_files_at(data_dir.stat().st_mtime)
+
+
+@st.cache_data(ttl=30)
+def _rate_limit() -> dict:
+    return dl.get_rate_limit_status()
+
+
+@st.cache_data(ttl=900)
+def _market_news() -> dict:
+    return dl.get_market_news_sentiment()
+
+
+@st.cache_data(ttl=900)
+def _watchlist_news() -> list:
+    return dl.get_watchlist_news_sentiment()
+
+
+@st.cache_data(ttl=900)
+def _news(symbol: str) -> dict:
+    return dl.get_news_sentiment(symbol)
+
+
+@st.cache_data(ttl=900)
+def _wsb_trending() -> list:
+    # Only the top ten symbol/mention pairs are displayed
+    return [
+        {'symbol': t['symbol'], 'mentions': t['mentions']}
+        for t in dl.get_wsb_trending()[:10]
+    ]
+
+
+@st.cache_data(ttl=900)
+def _stocktwits_trending() -> list:
+    return [{'symbol': t['symbol']} for t in dl.get_stocktwits_trending()[:10]]
+
+
+@st.cache_data(max_entries=8)
+def _read_backtest_csv(path: str, mtime: float, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """Load a backtest file's columns. Keyed on mtime so a rewritten file is re-read."""
+    return dl.read_backtest_file(Path(path), columns)
+
+
 def render_header():
     """Render dashboard header."""
     col1, col2, col3 = st.columns([3, 1, 1])
@@ -90,17 +262,17 @@ def render_header():
         st.title("📈 KTrade Dashboard")
 
     with col2:
-        market_status = "🟢 Market Open" if is_market_open() else "🔴 Market Closed"
+        market_status = "🟢 Market Open" if dl.is_market_open() else "🔴 Market Closed"
         st.markdown(f"### {market_status}")
 
     with col3:
         st.markdown(f"### 📄 Paper Trading")
-        st.caption(f"Last updated: {datetime.now().strftime('%H:%M:%S')}")
+        st.caption(f"Last updated: {time.strftime('%H:%M:%S')}")
 
 
 def render_portfolio_summary():
     """Render portfolio summary metrics."""
-    summary = get_portfolio_summary()
+    summary = _portfolio()
 
     if not summary:
         st.warning("No portfolio data available. Make sure the bot is running.")
@@ -108,59 +280,80 @@ def render_portfolio_summary():
 
     st.subheader("Portfolio Overview")
 
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        st.metric(
-            "Portfolio Value",
-            format_currency(summary['total_value']),
-            format_pct(summary['total_return_pct'])
-        )
-
-    with col2:
-        st.metric(
-            "Today's P&L",
-            format_currency(summary['daily_pnl']),
-            format_pct(summary['daily_pnl_pct'])
-        )
+    value, pnl, cash, positions_value = format_currency_arr([
+        summary['total_value'],
+        summary['daily_pnl'],
+        summary['cash'],
+        summary['positions_value'],
+    ])
+    total_return, pnl_pct = format_pct_arr([summary['total_return_pct'], summary['daily_pnl_pct']])
+
+    render_metric_row([
+        ("Portfolio Value", value, total_return),
+        ("Today's P&L", pnl, pnl_pct),
+        ("Cash", cash, None),
+        ("Positions Value", positions_value, None),
+        ("Open Positions", summary['num_positions'], None),
+    ], columns=5)
+
+
+# Equity curves longer than this are downsampled before plotting
+EQUITY_MAX_POINTS = 2000
+
+# Line charts switch from SVG to WebGL above this many points
+WEBGL_MIN_POINTS = 1000
+
+# Static equity chart styling, built once at import
+_EQUITY_LAYOUT = dict(
+    height=400,
+    margin=dict(l=0, r=0, t=30, b=0),
+    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    hovermode="x unified",
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+)
+_GRID = dict(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+_BACKTEST_LAYOUT = dict(height=300, margin=dict(l=0, r=0, t=40, b=0))
 
-    with col3:
-        st.metric(
-            "Cash",
-            format_currency(summary['cash']),
-        )
 
-    with col4:
-        st.metric(
-            "Positions Value",
-            format_currency(summary['positions_value']),
-        )
+def _equity_plot_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Equity curve reduced to at most EQUITY_MAX_POINTS rows for plotting."""
+    if len(df) <= EQUITY_MAX_POINTS:
+        return df
 
-    with col5:
-        st.metric(
-            "Open Positions",
-            summary['num_positions'],
-        )
+    x = df['date'].to_numpy().astype(np.int64).astype(np.float64)
+    y = df['total_value'].to_numpy(dtype=np.float64)
+    return df.iloc[dl.lttb_indices(x, y, EQUITY_MAX_POINTS)]
 
 
 def render_equity_curve():
     """Render equity curve chart."""
     st.subheader("Equity Curve")
 
-    df = get_equity_curve()
+    df = dl.get_equity_curve()
 
     if df.empty:
         st.info("No equity data available yet. Run a backtest or start trading to see data.")
         return
 
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    df = _equity_plot_frame(df)
+
+    # Plotly serializes plain arrays faster than Series
+    x = df['date'].to_numpy()
+    y = df['total_value'].to_numpy()
+
     # Create figure with secondary y-axis
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
-    # Add equity line
+    # Add equity line (WebGL keeps long curves responsive, SVG stays crisper for short ones)
+    scatter = go.Scattergl if len(x) > WEBGL_MIN_POINTS else go.Scatter
     fig.add_trace(
-        go.Scatter(
-            x=df['date'],
-            y=df['total_value'],
+        scatter(
+            x=x,
+            y=y,
             name="Portfolio Value",
             line=dict(color='#00c853', width=2),
             fill='tozeroy',
@@ -171,11 +364,12 @@ def render_equity_curve():
 
     # Add daily return bars if available
     if 'daily_return_pct' in df.columns:
-        colors = ['#00c853' if x >= 0 else '#ff5252' for x in df['daily_return_pct']]
+        daily_returns = df['daily_return_pct'].to_numpy()
+        colors = np.where(daily_returns >= 0, '#00c853', '#ff5252')
         fig.add_trace(
             go.Bar(
-                x=df['date'],
-                y=df['daily_return_pct'],
+                x=x,
+                y=daily_returns,
                 name="Daily Return %",
                 marker_color=colors,
                 opacity=0.5
@@ -183,145 +377,169 @@ def render_equity_curve():
             secondary_y=True
         )
 
-    fig.update_layout(
-        height=400,
-        margin=dict(l=0, r=0, t=30, b=0),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        hovermode="x unified",
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-    )
+    fig.update_layout(**_EQUITY_LAYOUT)
 
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-    fig.update_yaxes(title_text="Portfolio Value ($)", secondary_y=False, showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+    fig.update_xaxes(**_GRID)
+    fig.update_yaxes(title_text="Portfolio Value ($)", secondary_y=False, **_GRID)
     fig.update_yaxes(title_text="Daily Return (%)", secondary_y=True)
 
     st.plotly_chart(fig, use_container_width=True)
 
 
+# Raw numeric columns are shipped as-is and formatted by the browser,
+# which also keeps client-side sorting numeric
+POSITION_COLUMN_CONFIG = {
+    'symbol': st.column_config.TextColumn('Symbol'),
+    'quantity': st.column_config.NumberColumn('Qty'),
+    'avg_entry_price': st.column_config.NumberColumn('Entry Price', format='$%.2f'),
+    'current_price': st.column_config.NumberColumn('Current Price', format='$%.2f'),
+    'market_value': st.column_config.NumberColumn('Market Value', format='$%.2f'),
+    'unrealized_pnl': st.column_config.NumberColumn('P&L', format='$%.2f'),
+    'unrealized_pnl_pct': st.column_config.NumberColumn('P&L %', format='%+.2f%%'),
+}
+
+TRADE_COLUMN_CONFIG = {
+    'Date': st.column_config.DatetimeColumn('Date', format='MMM D, YYYY h:mm a'),
+    'symbol': st.column_config.TextColumn('Symbol'),
+    'Side': st.column_config.TextColumn('Side'),
+    'quantity': st.column_config.NumberColumn('Qty'),
+    'price': st.column_config.NumberColumn('Price', format='$%.2f'),
+    'value': st.column_config.NumberColumn('Value', format='$%.2f'),
+    'reason': st.column_config.TextColumn('Reason'),
+}
+
+
 def render_positions():
     """Render current positions table."""
     st.subheader("Current Positions")
 
-    positions = get_positions()
+    positions = _positions()
 
     if not positions:
         st.info("No open positions")
         return
 
-    # Convert to DataFrame for display
-    df = pd.DataFrame(positions)
-
-    # Style the dataframe
-    def style_pnl(val):
-        if isinstance(val, (int, float)):
-            color = 'green' if val >= 0 else 'red'
-            return f'color: {color}'
-        return ''
-
-    # Format columns
-    if 'unrealized_pnl' in df.columns:
-        df['P&L'] = df['unrealized_pnl'].apply(lambda x: format_currency(x))
-        df['P&L %'] = df['unrealized_pnl_pct'].apply(lambda x: format_pct(x))
-
-    if 'current_price' in df.columns:
-        df['Current Price'] = df['current_price'].apply(lambda x: f"${x:.2f}")
-
-    if 'avg_entry_price' in df.columns:
-        df['Entry Price'] = df['avg_entry_price'].apply(lambda x: f"${x:.2f}")
-
-    if 'market_value' in df.columns:
-        df['Market Value'] = df['market_value'].apply(lambda x: format_currency(x))
-
-    # Select and rename columns for display
-    display_cols = ['symbol', 'quantity', 'Entry Price', 'Current Price', 'Market Value', 'P&L', 'P&L %']
-    display_cols = [c for c in display_cols if c in df.columns]
+    # Columns arrive as typed arrays
+    display_cols = [c for c in POSITION_COLUMN_CONFIG if c in positions]
 
     if display_cols:
+        # Ship only the displayed columns to the browser
+        out = pd.DataFrame({c: positions[c] for c in display_cols})
+        out['symbol'] = out['symbol'].astype('category')
         st.dataframe(
-            df[display_cols],
+            out,
+            column_config=POSITION_COLUMN_CONFIG,
             use_container_width=True,
             hide_index=True
         )
 
 
-def render_recent_trades():
-    """Render recent trades table."""
-    st.subheader("Recent Trades")
-
-    trades = get_recent_trades(limit=20)
+@st.cache_data(ttl=15)
+def _trades_frame(limit: int) -> pd.DataFrame:
+    """Recent trades ready for display (empty if there are none)."""
+    trades = dl.to_columns(dl.get_recent_trades(limit=limit), dl.TRADE_COLUMNS)
 
     if not trades:
-        st.info("No trades yet")
-        return
+        return pd.DataFrame()
 
     df = pd.DataFrame(trades)
 
-    # Format columns with friendly date/time
+    # Collected, then added in one assign
+    derived = {}
+
+    # DB trades carry 'timestamp', backtest trades 'date' (both datetime64)
     if 'timestamp' in df.columns:
-        df['Date'] = pd.to_datetime(df['timestamp']).dt.strftime('%b %d, %Y %-I:%M %p')
+        derived['Date'] = df['timestamp']
     elif 'date' in df.columns:
-        df['Date'] = pd.to_datetime(df['date']).dt.strftime('%b %d, %Y %-I:%M %p')
-
-    if 'price' in df.columns:
-        df['Price'] = df['price'].apply(lambda x: f"${x:.2f}")
+        derived['Date'] = df['date']
 
-    if 'value' in df.columns:
-        df['Value'] = df['value'].apply(lambda x: format_currency(x))
-    elif 'total_value' in df.columns:
-        df['Value'] = df['total_value'].apply(lambda x: format_currency(x))
+    if 'value' not in df.columns and 'total_value' in df.columns:
+        derived['value'] = df['total_value']
 
     # Color code buy/sell
     if 'side' in df.columns:
-        df['Side'] = df['side'].apply(lambda x: f"🟢 {x.upper()}" if x.lower() == 'buy' else f"🔴 {x.upper()}")
+        side = df['side'].astype(str)
+        derived['Side'] = np.where(side.str.lower() == 'buy', '🟢 ', '🔴 ') + side.str.upper()
 
-    # Select columns for display
-    display_cols = ['Date', 'symbol', 'Side', 'quantity', 'Price', 'Value', 'reason']
-    display_cols = [c for c in display_cols if c in df.columns]
+    df = df.assign(**derived)
 
-    if display_cols:
-        st.dataframe(
-            df[display_cols],
-            use_container_width=True,
-            hide_index=True
-        )
+    # Compact frame: only displayed columns, repeated strings as categories
+    display_cols = [c for c in TRADE_COLUMN_CONFIG if c in df.columns]
+    out = df.loc[:, display_cols].copy()
+    for col in ('symbol', 'Side'):
+        if col in out.columns:
+            out[col] = out[col].astype('category')
+
+    return out
+
+
+def render_recent_trades():
+    """Render recent trades table."""
+    st.subheader("Recent Trades")
+
+    df = _trades_frame(limit=20)
+
+    if df.empty:
+        st.info("No trades yet")
+        return
+
+    st.dataframe(
+        df,
+        column_config=TRADE_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True
+    )
 
 
 def render_metrics():
     """Render performance metrics."""
     st.subheader("Performance Metrics")
 
-    metrics = get_performance_metrics()
+    metrics = dl.get_performance_metrics()
 
     if not metrics:
         st.info("No performance metrics available. Run a backtest to see metrics.")
         return
 
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("Total Return", format_pct(metrics.get('total_return_pct', 0)))
-        st.metric("Win Rate", f"{metrics.get('win_rate_pct', 0):.1f}%")
-
-    with col2:
-        st.metric("Sharpe Ratio", f"{metrics.get('sharpe_ratio', 0):.2f}")
-        st.metric("Sortino Ratio", f"{metrics.get('sortino_ratio', 0):.2f}")
-
-    with col3:
-        st.metric("Max Drawdown", f"{metrics.get('max_drawdown_pct', 0):.2f}%")
-        st.metric("Profit Factor", f"{metrics.get('profit_factor', 0):.2f}")
+    total_return, avg_trade = format_pct_arr([
+        metrics.get('total_return_pct', 0),
+        metrics.get('avg_trade_pct', 0),
+    ])
 
-    with col4:
-        st.metric("Total Trades", metrics.get('total_trades', 0))
-        st.metric("Avg Trade", format_pct(metrics.get('avg_trade_pct', 0)))
+    render_metric_row([
+        ("Total Return", total_return, None),
+        ("Sharpe Ratio", f"{metrics.get('sharpe_ratio', 0):.2f}", None),
+        ("Max Drawdown", f"{metrics.get('max_drawdown_pct', 0):.2f}%", None),
+        ("Total Trades", metrics.get('total_trades', 0), None),
+        ("Win Rate", f"{metrics.get('win_rate_pct', 0):.1f}%", None),
+        ("Sortino Ratio", f"{metrics.get('sortino_ratio', 0):.2f}", None),
+        ("Profit Factor", f"{metrics.get('profit_factor', 0):.2f}", None),
+        ("Avg Trade", avg_trade, None),
+    ], columns=4)
 
 
+@st.fragment
 def render_sentiment():
     """Render sentiment analysis section."""
     st.subheader("Market Sentiment")
 
+    cache = _cache()
+
+    # Issue the independent sentiment requests together rather than back to back
+    loaders = {
+        'rate_status': _rate_limit,
+        'wsb_trending': _wsb_trending,
+        'st_trending': _stocktwits_trending,
+    }
+    # Market news is only fetched on initial load, not when buttons are clicked
+    if cache.market_news is None:
+        loaders['market_news'] = _market_news
+    feeds = _load_concurrently(**loaders)
+    if 'market_news' in feeds:
+        cache.market_news = feeds['market_news']
+
     # Show rate limit status
-    rate_status = get_rate_limit_status()
+    rate_status = feeds['rate_status']
     if rate_status and 'requests_remaining' in rate_status:
         remaining = rate_status['requests_remaining']
         made = rate_status['requests_made']
@@ -340,12 +558,8 @@ def render_sentiment():
             f"(refreshes ~every {rate_status.get('recommended_interval_minutes', 60)} min)"
         )
 
-    # Market mood from news - use session state to avoid refetching on every rerun
-    # Only fetch on initial load, not when buttons are clicked
-    if 'market_news_cache' not in st.session_state:
-        st.session_state.market_news_cache = get_market_news_sentiment()
-
-    market_news = st.session_state.market_news_cache
+    # Market mood from news - kept in session state to avoid refetching on every rerun
+    market_news = cache.market_news
     if market_news and 'market_sentiment' in market_news:
         score = market_news['market_sentiment']
         if score > 0.15:
@@ -367,11 +581,6 @@ def render_sentiment():
     with col1:
         st.markdown("#### 🔍 Symbol News Lookup")
 
-        # Initialize session state for symbol lookup
-        if 'symbol_sentiment_cache' not in st.session_state:
-            st.session_state.symbol_sentiment_cache = None
-            st.session_state.symbol_sentiment_symbol = None
-
         # Symbol input
         lookup_symbol = st.text_input(
             "Enter symbol",
@@ -382,14 +591,12 @@ def render_sentiment():
 
         if st.button("Get News Sentiment", key="lookup_btn"):
             with st.spinner(f"Fetching news for {lookup_symbol}..."):
-                sentiment = get_news_sentiment(lookup_symbol)
-                st.session_state.symbol_sentiment_cache = sentiment
-                st.session_state.symbol_sentiment_symbol = lookup_symbol
+                sentiment = _news(lookup_symbol)
+                cache.symbol_sentiment = (lookup_symbol, sentiment)
 
         # Display cached result
-        if st.session_state.symbol_sentiment_cache and st.session_state.symbol_sentiment_symbol:
-            sentiment = st.session_state.symbol_sentiment_cache
-            symbol = st.session_state.symbol_sentiment_symbol
+        if cache.symbol_sentiment and cache.symbol_sentiment[1]:
+            symbol, sentiment = cache.symbol_sentiment
 
             if sentiment and 'error' not in sentiment:
                 score = sentiment.get('sentiment_score', 0)
@@ -406,14 +613,16 @@ def render_sentiment():
                 st.caption(f"Based on {sentiment.get('article_count', 0)} articles")
 
                 # Show headlines
-                articles = sentiment.get('articles', [])
+                articles = sentiment.get('articles', [])[:5]
                 if articles:
-                    st.markdown("**Recent Headlines:**")
-                    for article in articles[:5]:
-                        title = article.get('title', 'No title')[:80]
-                        art_score = article.get('sentiment_score', 0)
-                        emoji = "🟢" if art_score > 0.1 else "🔴" if art_score < -0.1 else "🟡"
-                        st.markdown(f"- {emoji} {title}...")
+                    # One markdown element instead of one per headline
+                    scores = np.array([a.get('sentiment_score', 0) for a in articles], dtype=float)
+                    emojis = np.select([scores > 0.1, scores < -0.1], ['🟢', '🔴'], default='🟡')
+                    lines = [
+                        f"- {emoji} {article.get('title', 'No title')[:80]}..."
+                        for emoji, article in zip(emojis, articles)
+                    ]
+                    st.markdown("**Recent Headlines:**\n" + "\n".join(lines))
             else:
                 error_msg = sentiment.get('error', 'Unknown error') if sentiment else 'No data'
                 st.error(f"Could not fetch news for {symbol}: {error_msg}")
@@ -422,19 +631,15 @@ def render_sentiment():
         st.markdown("#### 📊 Watchlist Sentiment")
 
         # Use cached watchlist sentiment, only fetch on button click
-        if 'watchlist_sentiment_cache' not in st.session_state:
-            st.session_state.watchlist_sentiment_cache = None
-
-        watchlist_sentiment = st.session_state.watchlist_sentiment_cache
+        watchlist_sentiment = cache.watchlist_sentiment
 
         if watchlist_sentiment:
-            df = pd.DataFrame(watchlist_sentiment)
+            df = pd.DataFrame(dl.to_columns(watchlist_sentiment, dl.NEWS_SENTIMENT_COLUMNS))
 
             # Add emoji indicator
-            df['Mood'] = df['sentiment_score'].apply(
-                lambda x: "🟢" if x > 0.15 else "🔴" if x < -0.15 else "🟡"
-            )
-            df['Score'] = df['sentiment_score'].apply(lambda x: f"{x:+.2f}")
+            score = df['sentiment_score'].to_numpy(dtype=float)
+            df['Mood'] = np.select([score > 0.15, score < -0.15], ['🟢', '🔴'], default='🟡')
+            df['Score'] = df['sentiment_score'].map('{:+.2f}'.format)
             df['Articles'] = df['article_count']
 
             st.dataframe(
@@ -447,8 +652,8 @@ def render_sentiment():
 
             if st.button("Load Sentiment", key="load_watchlist"):
                 with st.spinner("Fetching watchlist sentiment..."):
-                    st.session_state.watchlist_sentiment_cache = get_watchlist_news_sentiment()
-                st.rerun()
+                    cache.watchlist_sentiment = _watchlist_news()
+                st.rerun(scope="fragment")
 
     st.divider()
 
@@ -458,129 +663,162 @@ def render_sentiment():
 
         with col1:
             st.markdown("**WSB Trending**")
-            wsb_trending = get_wsb_trending()
+            wsb_trending = feeds['wsb_trending']
             if wsb_trending:
-                wsb_df = pd.DataFrame(wsb_trending)
-                st.dataframe(wsb_df[['symbol', 'mentions']].head(10), hide_index=True)
+                st.dataframe(wsb_trending, hide_index=True)
             else:
                 st.caption("Requires Quiver Quant subscription")
 
         with col2:
             st.markdown("**StockTwits Trending**")
-            st_trending = get_stocktwits_trending()
+            st_trending = feeds['st_trending']
             if st_trending:
-                st_df = pd.DataFrame(st_trending)
-                st.dataframe(st_df[['symbol']].head(10), hide_index=True)
+                st.dataframe(st_trending, hide_index=True)
             else:
                 st.caption("API temporarily unavailable")
 
 
+SIGNAL_COLUMNS = ['symbol', 'signal_type', 'confidence', 'strategy', 'notes']
+
+
+def _signals_frame(signals: list) -> pd.DataFrame:
+    """Signals as a DataFrame with the display confidence precomputed."""
+    sdf = pd.DataFrame(signals, columns=SIGNAL_COLUMNS)
+    sdf['confidence_pct'] = (sdf['confidence'].to_numpy(dtype=float) * 100).round().astype(int)
+    return sdf
+
+
+def _signal_markdown(signals: pd.DataFrame, emojis: np.ndarray) -> str:
+    """One markdown block listing signals, built from column arrays."""
+    notes = signals['notes'].fillna('').str.slice(0, 60).to_numpy()
+    return "\n\n".join(
+        f"{emoji} **{symbol}** - {conf}% confidence\n\n   *{strategy}*: {note}..."
+        for emoji, symbol, conf, strategy, note in zip(
+            emojis,
+            signals['symbol'].to_numpy(),
+            signals['confidence_pct'].to_numpy(),
+            signals['strategy'].to_numpy(),
+            notes,
+        )
+    )
+
+
+@st.fragment
 def render_trading_signals():
     """Render current trading signals panel."""
     st.subheader("📡 Trading Signals")
 
-    # Use session state to cache signals
-    if 'signals_cache' not in st.session_state:
-        st.session_state.signals_cache = None
+    # Signals are generated on demand and kept in the session cache
+    cache = _cache()
 
     col1, col2 = st.columns([3, 1])
 
     with col2:
         if st.button("🔄 Refresh Signals", key="refresh_signals"):
             with st.spinner("Generating signals..."):
-                st.session_state.signals_cache = get_current_signals()
-            st.rerun()
+                cache.signals = _signals_frame(dl.get_current_signals())
+            st.rerun(scope="fragment")
 
     with col1:
-        if st.session_state.signals_cache is None:
+        if cache.signals is None:
             st.info("Click 'Refresh Signals' to generate current trading signals")
             return
 
-    signals = st.session_state.signals_cache
+    sdf = cache.signals
 
-    if not signals:
+    if sdf.empty:
         st.info("No trading signals generated. Market may be closed or no opportunities detected.")
         return
 
-    # Group signals by type
-    buy_signals = [s for s in signals if s['signal_type'] == 'buy']
-    sell_signals = [s for s in signals if s['signal_type'] == 'sell']
+    # Group signals by type, keeping the five most confident of each
+    signal_type = sdf['signal_type'].to_numpy()
+    buy_signals = sdf[signal_type == 'buy'].nlargest(5, 'confidence')
+    sell_signals = sdf[signal_type == 'sell'].nlargest(5, 'confidence')
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("#### 🟢 BUY Signals")
-        if buy_signals:
-            for sig in buy_signals[:5]:
-                confidence_pct = sig['confidence'] * 100
-                emoji = "🔥" if confidence_pct >= 80 else "✅" if confidence_pct >= 70 else "📈"
-                st.markdown(
-                    f"{emoji} **{sig['symbol']}** - {confidence_pct:.0f}% confidence\n\n"
-                    f"   *{sig['strategy']}*: {sig['notes'][:60]}..."
-                )
+        if not buy_signals.empty:
+            conf = buy_signals['confidence_pct'].to_numpy()
+            emojis = np.select([conf >= 80, conf >= 70], ['🔥', '✅'], default='📈')
+            st.markdown(_signal_markdown(buy_signals, emojis))
         else:
             st.caption("No buy signals")
 
     with col2:
         st.markdown("#### 🔴 SELL Signals")
-        if sell_signals:
-            for sig in sell_signals[:5]:
-                confidence_pct = sig['confidence'] * 100
-                emoji = "⚠️" if confidence_pct >= 80 else "📉"
-                st.markdown(
-                    f"{emoji} **{sig['symbol']}** - {confidence_pct:.0f}% confidence\n\n"
-                    f"   *{sig['strategy']}*: {sig['notes'][:60]}..."
-                )
+        if not sell_signals.empty:
+            conf = sell_signals['confidence_pct'].to_numpy()
+            emojis = np.where(conf >= 80, '⚠️', '📉')
+            st.markdown(_signal_markdown(sell_signals, emojis))
         else:
             st.caption("No sell signals")
 
 
+STRATEGY_DISPLAY_NAMES = {
+    'simple_momentum': '📈 Momentum',
+    'news_momentum': '📰 News',
+    'dca': '💰 DCA',
+    'grid': '📐 Grid',
+    'other': '❓ Other',
+}
+
+
 def render_strategy_performance():
     """Render strategy performance breakdown."""
     st.subheader("📊 Strategy Performance")
 
-    perf = get_strategy_performance()
+    perf_df = _strategy_performance()
 
-    if not perf:
+    if perf_df.empty:
         st.info("No strategy performance data available. Execute some trades first.")
         return
 
     # Create columns for each strategy
-    cols = st.columns(len(perf))
-
-    strategy_names = {
-        'simple_momentum': '📈 Momentum',
-        'news_momentum': '📰 News',
-        'dca': '💰 DCA',
-        'grid': '📐 Grid',
-        'other': '❓ Other',
-    }
+    cols = st.columns(len(perf_df))
 
-    for idx, (strat_name, stats) in enumerate(perf.items()):
-        with cols[idx]:
-            display_name = strategy_names.get(strat_name, strat_name)
+    for col, stats in zip(cols, perf_df.itertuples()):
+        with col:
+            display_name = STRATEGY_DISPLAY_NAMES.get(stats.Index, stats.Index)
             st.markdown(f"**{display_name}**")
 
-            st.metric("Trades", stats['trades'])
-            st.caption(f"📥 {stats['buys']} buys / 📤 {stats['sells']} sells")
-            st.caption(f"🏷️ {stats['symbols_traded']} symbols")
-            st.caption(f"💵 ${stats['total_value']:,.0f} volume")
+            st.metric("Trades", stats.trades)
+            st.caption(f"📥 {stats.buys} buys / 📤 {stats.sells} sells")
+            st.caption(f"🏷️ {stats.symbols_traded} symbols")
+            st.caption(f"💵 ${stats.total_value:,.0f} volume")
 
             # Show percentage as progress bar
-            st.progress(min(1.0, stats['pct_of_trades'] / 100))
-            st.caption(f"{stats['pct_of_trades']:.1f}% of trades")
+            st.progress(stats.progress)
+            st.caption(f"{stats.pct_of_trades:.1f}% of trades")
 
 
 def render_risk_monitor():
     """Render risk monitoring section."""
     st.subheader("⚠️ Risk Monitor")
 
-    risk = get_risk_metrics()
+    risk = _risk()
 
     if not risk:
         st.info("No risk data available.")
         return
 
+    # Progress toward each limit: daily loss, exposure, concentration
+    pairs = np.array([
+        [risk['daily_loss_used_pct'], risk['daily_loss_limit_pct']],
+        [risk['exposure_pct'], risk['max_exposure_pct']],
+        [risk['largest_position_pct'], risk['max_position_size_pct']],
+    ], dtype=float)
+    progress = np.minimum(
+        1.0,
+        np.divide(pairs[:, 0], pairs[:, 1], out=np.zeros(3), where=pairs[:, 1] > 0)
+    )
+
+    # Shared formatting for the dollar captions
+    daily_pnl_str, cash_str, invested_str = format_currency_arr(
+        [risk['daily_pnl'], risk['cash'], risk['positions_value']]
+    )
+
     # Create three columns for different risk categories
     col1, col2, col3 = st.columns(3)
 
@@ -590,7 +828,6 @@ def render_risk_monitor():
         # Progress bar for daily loss
         used_pct = risk['daily_loss_used_pct']
         limit_pct = risk['daily_loss_limit_pct']
-        progress = min(1.0, used_pct / limit_pct) if limit_pct > 0 else 0
 
         if risk['daily_loss_critical']:
             st.error(f"🛑 LIMIT REACHED: {used_pct:.2f}% / {limit_pct:.1f}%")
@@ -599,31 +836,29 @@ def render_risk_monitor():
         else:
             st.success(f"✅ OK: {used_pct:.2f}% / {limit_pct:.1f}%")
 
-        st.progress(progress)
-        st.caption(f"Today's P&L: {format_currency(risk['daily_pnl'])} ({format_pct(risk['daily_pnl_pct'])})")
+        st.progress(progress[0])
+        st.caption(f"Today's P&L: {daily_pnl_str} ({format_pct(risk['daily_pnl_pct'])})")
 
     with col2:
         st.markdown("#### Portfolio Exposure")
 
         exposure = risk['exposure_pct']
         max_exp = risk['max_exposure_pct']
-        exp_progress = min(1.0, exposure / max_exp) if max_exp > 0 else 0
 
         if risk['exposure_warning']:
             st.warning(f"⚠️ Near max: {exposure:.1f}% / {max_exp:.1f}%")
         else:
             st.success(f"✅ OK: {exposure:.1f}% / {max_exp:.1f}%")
 
-        st.progress(exp_progress)
-        st.caption(f"Cash: {format_currency(risk['cash'])}")
-        st.caption(f"Invested: {format_currency(risk['positions_value'])}")
+        st.progress(progress[1])
+        st.caption(f"Cash: {cash_str}")
+        st.caption(f"Invested: {invested_str}")
 
     with col3:
         st.markdown("#### Position Concentration")
 
         largest = risk['largest_position_pct']
         max_size = risk['max_position_size_pct']
-        conc_progress = min(1.0, largest / max_size) if max_size > 0 else 0
 
         if risk['concentration_warning']:
             st.warning(f"⚠️ {risk['largest_position_symbol']}: {largest:.1f}% / {max_size:.1f}%")
@@ -633,68 +868,71 @@ def render_risk_monitor():
             else:
                 st.info("No positions")
 
-        st.progress(conc_progress)
+        st.progress(progress[2])
         st.caption(f"{risk['num_positions']} open positions")
 
 
+@st.fragment
 def render_live_watchlist():
     """Render live watchlist with prices and signals."""
     st.subheader("👁️ Live Watchlist")
 
-    # Use session state to cache watchlist data
-    if 'watchlist_cache' not in st.session_state:
-        st.session_state.watchlist_cache = None
+    # Watchlist data is fetched on demand and kept in the session cache
+    cache = _cache()
 
     col1, col2 = st.columns([3, 1])
 
     with col2:
         if st.button("🔄 Refresh Watchlist", key="refresh_watchlist"):
             with st.spinner("Fetching market data..."):
-                st.session_state.watchlist_cache = get_watchlist_data()
-            st.rerun()
+                cache.watchlist = dl.get_watchlist_data(force_refresh=True)
+            st.rerun(scope="fragment")
 
     with col1:
-        if st.session_state.watchlist_cache is None:
+        if cache.watchlist is None:
             st.info("Click 'Refresh Watchlist' to load current prices and signals")
             return
 
-    watchlist = st.session_state.watchlist_cache
+    watchlist = cache.watchlist
 
     if not watchlist:
         st.info("No watchlist data available. Check your watchlist configuration.")
         return
 
     # Convert to DataFrame for display
-    df = pd.DataFrame(watchlist)
+    df = pd.DataFrame(dl.to_columns(watchlist, dl.WATCHLIST_COLUMNS))
 
     # Format columns
-    df['Price'] = df['price'].apply(lambda x: f"${x:.2f}")
-    df['Change'] = df['change_pct'].apply(lambda x: f"{x:+.2f}%")
-    df['RSI'] = df['rsi'].apply(lambda x: f"{x:.1f}" if x else "N/A")
-    df['vs SMA'] = df['vs_sma'].apply(lambda x: f"{x:+.1f}%")
-    df['Vol Ratio'] = df['volume_ratio'].apply(lambda x: f"{x:.1f}x")
+    rsi = df['rsi'].astype(float)
+    df['Price'] = df['price'].map('${:.2f}'.format)
+    df['Change'] = format_pct_arr(df['change_pct'].to_numpy())
+    df['RSI'] = rsi.map('{:.1f}'.format).where(rsi.notna() & (rsi != 0), 'N/A')
+    df['vs SMA'] = df['vs_sma'].map('{:+.1f}%'.format)
+    df['Vol Ratio'] = df['volume_ratio'].map('{:.1f}x'.format)
 
     # Signal with emoji
-    def format_signal(row):
-        sig = row['signal']
-        strength = row['signal_strength']
-        if sig == 'BUY':
-            return f"🟢 BUY ({strength:.0%})"
-        elif sig == 'SELL':
-            return f"🔴 SELL ({strength:.0%})"
-        return "⚪ HOLD"
-
-    df['Signal'] = df.apply(format_signal, axis=1)
+    signal = df['signal'].to_numpy()
+    strength_pct = pd.Series(
+        (df['signal_strength'].to_numpy(dtype=float) * 100).round().astype(int).astype(str)
+    )
+    df['Signal'] = np.select(
+        [signal == 'BUY', signal == 'SELL'],
+        ['🟢 BUY (' + strength_pct + '%)', '🔴 SELL (' + strength_pct + '%)'],
+        default='⚪ HOLD'
+    )
 
     # Owned indicator
-    df['Owned'] = df['owned'].apply(lambda x: "✅" if x else "")
+    df['Owned'] = np.where(df['owned'].to_numpy(dtype=bool), '✅', '')
 
     # Select columns for display
     display_cols = ['symbol', 'Price', 'Change', 'RSI', 'vs SMA', 'Vol Ratio', 'Signal', 'Owned']
 
+    out = df.loc[:, display_cols].rename(columns={'symbol': 'Symbol'})
+    out['Symbol'] = out['Symbol'].astype('category')
+
     # Style the dataframe
     st.dataframe(
-        df[display_cols].rename(columns={'symbol': 'Symbol'}),
+        out,
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -710,12 +948,10 @@ def render_live_watchlist():
     )
 
 
-def render_backtest_selector():
+def render_backtest_selector(backtest_files: list):
     """Render backtest results selector."""
     st.subheader("Backtest Results")
 
-    backtest_files = get_backtest_results()
-
     if not backtest_files:
         st.info("No backtest results found. Run `python scripts/run_backtest.py` to generate results.")
         return
@@ -727,20 +963,20 @@ def render_backtest_selector():
     )
 
     if selected:
-        df = pd.read_csv(selected)
+        df = _read_backtest_csv(str(selected), selected.stat().st_mtime, dl.BACKTEST_EQUITY_COLUMNS)
 
         # Show equity curve from backtest
         if 'total_value' in df.columns:
+            import plotly.express as px
+            plot_df = _equity_plot_frame(df) if len(df) else df
             fig = px.line(
-                df,
+                plot_df,
                 x='date',
                 y='total_value',
-                title='Backtest Equity Curve'
-            )
-            fig.update_layout(
-                height=300,
-                margin=dict(l=0, r=0, t=40, b=0),
+                title='Backtest Equity Curve',
+                render_mode='webgl' if len(plot_df) > WEBGL_MIN_POINTS else 'svg',
             )
+            fig.update_layout(**_BACKTEST_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
 
         # Show summary stats
@@ -758,15 +994,17 @@ def render_backtest_selector():
                 st.metric("Return", format_pct(total_return))
 
 
+# Seconds between automatic redraws of the live panels
+AUTO_REFRESH_SECONDS = 30
+
+
 def render_sidebar():
     """Render sidebar with controls."""
     with st.sidebar:
         st.header("Controls")
 
-        # Auto-refresh toggle
-        auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
-        if auto_refresh:
-            st.rerun()
+        # Auto-refresh toggle (read by main() to schedule the live panels)
+        st.checkbox(f"Auto-refresh ({AUTO_REFRESH_SECONDS}s)", value=False, key="auto_refresh")
 
         st.divider()
 
@@ -785,17 +1023,9 @@ def render_sidebar():
 
         if st.button("🔄 Refresh Data"):
             # Clear all caches to force refresh
-            caches_to_clear = [
-                'market_news_cache',
-                'watchlist_sentiment_cache',
-                'symbol_sentiment_cache',
-                'symbol_sentiment_symbol',
-                'signals_cache',
-                'watchlist_cache',
-            ]
-            for cache_key in caches_to_clear:
-                if cache_key in st.session_state:
-                    del st.session_state[cache_key]
+            st.cache_data.clear()
+            dl.clear_caches()
+            st.session_state['_dc'] = DashCache()
             st.rerun()
 
         st.divider()
@@ -807,10 +1037,41 @@ def render_sidebar():
         return data_source
 
 
+def render_performance_row():
+    """Equity curve and metrics side by side."""
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        render_equity_curve()
+
+    with col2:
+        render_metrics()
+
+
+def render_holdings_row():
+    """Positions and recent trades side by side."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        render_positions()
+
+    with col2:
+        render_recent_trades()
+
+
+def render_live_panel(render, run_every: Optional[int]):
+    """
+    Render a live panel as a fragment. With run_every set, only that
+    fragment re-runs on the timer instead of the whole script.
+    """
+    st.fragment(run_every=run_every)(render)()
+
+
 def main():
     """Main dashboard entry point."""
     # Render sidebar
     data_source = render_sidebar()
+    run_every = AUTO_REFRESH_SECONDS if st.session_state.get('auto_refresh') else None
 
     # Header
     render_header()
@@ -819,24 +1080,30 @@ def main():
 
     # Main content based on data source
     if data_source == "Live/Paper Trading":
+        # Warm the cached loaders in parallel; the sections below then read
+        # from cache instead of each waiting on its own DB/API round trip
+        _load_concurrently(
+            portfolio=_portfolio,
+            risk=_risk,
+            equity=dl.get_equity_curve,
+            performance=dl.get_performance_metrics,
+            strategies=_strategy_performance,
+            positions=_positions,
+            trades=lambda: _trades_frame(limit=20),
+        )
+
         # Portfolio summary
-        render_portfolio_summary()
+        render_live_panel(render_portfolio_summary, run_every)
 
         st.divider()
 
-        # Risk Monitor - important to show early
-        render_risk_monitor()
+        # Risk Monitor - important to show early, and kept live with the other panels
+        render_live_panel(render_risk_monitor, run_every)
 
         st.divider()
 
         # Equity curve and metrics side by side
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            render_equity_curve()
-
-        with col2:
-            render_metrics()
+        render_live_panel(render_performance_row, run_every)
 
         st.divider()
 
@@ -857,13 +1124,7 @@ def main():
         st.divider()
 
         # Positions and trades
-        col1, col2 = st.columns(2)
-
-        with col1:
-            render_positions()
-
-        with col2:
-            render_recent_trades()
+        render_live_panel(render_holdings_row, run_every)
 
         st.divider()
 
@@ -872,15 +1133,17 @@ def main():
 
     else:
         # Backtest view
-        render_backtest_selector()
+        backtest_files = _backtest_files()
+        render_backtest_selector(backtest_files)
 
         # Load trades from most recent backtest
-        backtest_files = get_backtest_results()
         if backtest_files:
-            trades_file = str(backtest_files[0]).replace('equity', 'trades')
-            if Path(trades_file).exists():
+            trades_file = Path(str(backtest_files[0]).replace('equity', 'trades'))
+            if trades_file.exists():
                 st.subheader("Backtest Trades")
-                trades_df = pd.read_csv(trades_file)
+                trades_df = _read_backtest_csv(
+                    str(trades_file), trades_file.stat().st_mtime, dl.BACKTEST_TRADE_COLUMNS
+                )
                 st.dataframe(trades_df, use_container_width=True, hide_index=True)
 
 
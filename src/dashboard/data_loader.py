@@ -3,25 +3,44 @@ Data loader for the KTrade dashboard.
 Fetches data from database, Alpaca API, and backtest files.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
+from functools import lru_cache, partial, wraps
+from itertools import islice
+from operator import itemgetter
+from types import ModuleType
+from fnmatch import fnmatchcase
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+import io
+import json
+import os
+import re
+import threading
+import time
+import numpy as np
 import pandas as pd
 import pytz
+import structlog
 
-# Project imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
+# Project imports (the project root is on sys.path via the dashboard entry point)
 from config.settings import settings
 
+logger = structlog.get_logger(__name__)
+
 # Try to import database and API modules
 try:
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import scoped_session
     from src.database.session import SessionLocal
     from src.database.models import Position, Trade, Signal, PortfolioSnapshot
+
+    # One session per thread, reused across dashboard refreshes
+    DashboardSession = scoped_session(SessionLocal)
     DB_AVAILABLE = True
 except Exception as e:
-    print(f"Database import failed: {e}")
+    logger.warning("dashboard_db_unavailable", error=str(e))
     DB_AVAILABLE = False
 
 try:
@@ -31,12 +50,257 @@ except Exception:
     ALPACA_AVAILABLE = False
 
 try:
-    from src.data.sentiment_providers import sentiment_aggregator, quiver_provider, stocktwits_provider, news_provider
-    SENTIMENT_AVAILABLE = True
+    from src.data.indicators import calculate_all_indicators, get_latest_indicators
+    INDICATORS_AVAILABLE = True
 except Exception:
-    SENTIMENT_AVAILABLE = False
+    INDICATORS_AVAILABLE = False
+
+try:
+    from src.strategies.simple_momentum import SimpleMomentumStrategy
+    from src.strategies.news_momentum import NewsMomentumStrategy
+    STRATEGIES_AVAILABLE = True
+except Exception as e:
+    logger.warning("dashboard_strategies_unavailable", error=str(e))
+    STRATEGIES_AVAILABLE = False
+
+
+@lru_cache(maxsize=None)
+def _sentiment_providers() -> Optional[ModuleType]:
+    """
+    Import the sentiment providers on first use (None if unavailable).
+    They pull in HTTP clients and the sentiment models, which sessions that
+    never show sentiment data don't need.
+    """
+    try:
+        from src.data import sentiment_providers
+        return sentiment_providers
+    except Exception:
+        return None
+
+
+# Column dtypes for converting loader records to struct-of-arrays form
+POSITION_COLUMNS = {
+    'symbol': str,
+    'quantity': 'f8',
+    'avg_entry_price': 'f8',
+    'current_price': 'f8',
+    'market_value': 'f8',
+    'unrealized_pnl': 'f8',
+    'unrealized_pnl_pct': 'f8',
+}
+
+TRADE_COLUMNS = {
+    'timestamp': 'datetime64[ns]',
+    'date': 'datetime64[ns]',
+    'symbol': str,
+    'side': object,
+    'quantity': 'f8',
+    'price': 'f8',
+    'value': 'f8',
+    'reason': object,
+}
+
+WATCHLIST_COLUMNS = {
+    'symbol': str,
+    'price': 'f8',
+    'change_pct': 'f8',
+    'rsi': 'f8',
+    'vs_sma': 'f8',
+    'volume': 'f8',
+    'volume_ratio': 'f8',
+    'signal': str,
+    'signal_strength': 'f8',
+    'owned': bool,
+}
+
+NEWS_SENTIMENT_COLUMNS = {
+    'symbol': str,
+    'sentiment_score': 'f8',
+    'article_count': 'i8',
+    'sentiment_label': str,
+}
+
+# Column types written by scripts/run_backtest.py (equity and trades files).
+# Money stays float64 so values round-trip to the cent.
+BACKTEST_CSV_DTYPES = {
+    'total_value': 'float64',
+    'cash': 'float64',
+    'positions_value': 'float64',
+    'daily_return_pct': 'float64',
+    'symbol': 'category',
+    'side': 'category',
+    'quantity': 'float64',
+    'price': 'float64',
+    'value': 'float64',
+}
+
+BACKTEST_EQUITY_COLUMNS = ('date', 'total_value')
+BACKTEST_CURVE_COLUMNS = ('date', 'total_value', 'daily_return_pct')
+BACKTEST_TRADE_COLUMNS = ('date', 'symbol', 'side', 'quantity', 'price', 'value', 'reason')
+
+# Optional: pyarrow parses CSVs multithreaded; either engine enables parquet caching
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+PARQUET_AVAILABLE = PYARROW_AVAILABLE or importlib.util.find_spec('fastparquet') is not None
+
+
+def to_columns(records: List[Dict[str, Any]], dtypes: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Convert loader records to typed column arrays.
+    Building a DataFrame from these adopts each array as a column instead of
+    inferring a schema row by row. Columns absent from every record are skipped.
+
+    Args:
+        records: List of dicts as returned by the loaders
+        dtypes: Column name -> numpy dtype
+
+    Returns:
+        Dict of column name -> ndarray (empty if there are no records)
+    """
+    if not records:
+        return {}
+
+    return {
+        col: np.array([r.get(col) for r in records], dtype=dtype)
+        for col, dtype in dtypes.items()
+        if any(col in r for r in records)
+    }
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the indices of n_out points that best preserve the shape of y(x),
+    always keeping the first and last point.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+
+        # Third vertex is the average of the next bucket
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        ax, ay = x[selected], y[selected]
+        area = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+
+        selected = start + int(area.argmax())
+        indices[i + 1] = selected
+
+    return indices
+
+
+# Shared by every load_concurrently call; loaders are I/O bound
+_LOADER_THREAD_PREFIX = "dashboard-loader"
+_LOADER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix=_LOADER_THREAD_PREFIX)
+
+
+def load_concurrently(**loaders: Callable[[], Any]) -> Dict[str, Any]:
+    """
+    Run independent loaders concurrently on a shared thread pool.
+    The loaders are blocking HTTP/DB calls, so overlapping them cuts wall
+    time to roughly the slowest one. Each loader handles its own errors.
+    Called from inside a pool worker, the loaders run in order instead, so
+    nested calls can't wait on a pool they are occupying.
+
+    Example:
+        data = load_concurrently(signals=get_current_signals, watchlist=get_watchlist_data)
+    """
+    if threading.current_thread().name.startswith(_LOADER_THREAD_PREFIX):
+        return {name: fn() for name, fn in loaders.items()}
+
+    futures = {name: _LOADER_POOL.submit(fn) for name, fn in loaders.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+# (function name, args) -> (expiry, value); see ttl_cache
+_TTL_CACHE: Dict[tuple, tuple] = {}
+
+
+def ttl_cache(seconds: float) -> Callable:
+    """
+    Cache a loader's result for `seconds`.
+    Dashboard panels rendered in the same refresh then share one Alpaca
+    round trip instead of each making their own. If a refresh raises,
+    the previous value is kept for another `seconds`.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = _TTL_CACHE.get(key)
+            if cached and now < cached[0]:
+                return cached[1]
+            try:
+                value = fn(*args, **kwargs)
+            except Exception:
+                if cached is None:
+                    raise
+                value = cached[1]
+            _TTL_CACHE[key] = (now + seconds, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# key -> (version, value); see _stale_while_revalidate
+_SWR_CACHE: Dict[str, tuple] = {}
+_SWR_REFRESHING: set = set()
+_SWR_LOCK = threading.Lock()
+
+
+def _stale_while_revalidate(key: str, version: Any, compute: Callable[[], Any]) -> Any:
+    """
+    Serve the cached value for `key`, recomputing in the background when
+    `version` (e.g. a file's path and mtime) has moved on. Only the very
+    first call for a key computes inline. Cached values are shared, so
+    callers must not mutate them.
+    """
+    cached = _SWR_CACHE.get(key)
+    if cached is None:
+        value = compute()
+        _SWR_CACHE[key] = (version, value)
+        return value
+
+    if cached[0] != version:
+        with _SWR_LOCK:
+            start = key not in _SWR_REFRESHING
+            _SWR_REFRESHING.add(key)
+
+        if start:
+            def refresh():
+                try:
+                    _SWR_CACHE[key] = (version, compute())
+                finally:
+                    _SWR_REFRESHING.discard(key)
+
+            threading.Thread(target=refresh, daemon=True).start()
+
+    return cached[1]
+
 
+def clear_caches() -> None:
+    """Drop all cached loader results so the next calls fetch fresh data."""
+    _TTL_CACHE.clear()
+    _SWR_CACHE.clear()
+    _GLOB_CACHE.clear()
 
+
+@ttl_cache(60)
 def is_market_open() -> bool:
     """Check if market is currently open."""
     if not ALPACA_AVAILABLE:
@@ -49,6 +313,7 @@ def is_market_open() -> bool:
         return False
 
 
+@ttl_cache(2)
 def get_portfolio_summary() -> Optional[Dict[str, Any]]:
     """Get portfolio summary from Alpaca."""
     if not ALPACA_AVAILABLE:
@@ -91,24 +356,29 @@ def get_portfolio_summary() -> Optional[Dict[str, Any]]:
         }
 
     except Exception as e:
-        print(f"Error getting portfolio summary: {e}")
+        logger.error("failed_to_get_portfolio_summary", error=str(e))
         return _get_mock_portfolio_summary()
 
 
+_MOCK_PORTFOLIO_SUMMARY = {
+    'total_value': 100000.0,
+    'cash': 100000.0,
+    'positions_value': 0.0,
+    'daily_pnl': 0.0,
+    'daily_pnl_pct': 0.0,
+    'total_return': 0.0,
+    'total_return_pct': 0.0,
+    'num_positions': 0,
+}
+
+
 def _get_mock_portfolio_summary() -> Dict[str, Any]:
     """Return mock portfolio summary when API not available."""
-    return {
-        'total_value': 100000.0,
-        'cash': 100000.0,
-        'positions_value': 0.0,
-        'daily_pnl': 0.0,
-        'daily_pnl_pct': 0.0,
-        'total_return': 0.0,
-        'total_return_pct': 0.0,
-        'num_positions': 0,
-    }
+    # Shallow copy so callers can't alter the shared template
+    return dict(_MOCK_PORTFOLIO_SUMMARY)
 
 
+@ttl_cache(2)
 def get_positions() -> List[Dict[str, Any]]:
     """Get current positions from Alpaca."""
     if not ALPACA_AVAILABLE:
@@ -135,75 +405,119 @@ def get_positions() -> List[Dict[str, Any]]:
         return result
 
     except Exception as e:
-        print(f"Error getting positions: {e}")
+        logger.error("failed_to_get_positions", error=str(e))
         return []
 
 
+@ttl_cache(5)
 def get_recent_trades(limit: int = 20) -> List[Dict[str, Any]]:
     """Get recent trades from database or backtest files."""
     # First try database
     if DB_AVAILABLE:
         try:
-            db = SessionLocal()
-            trades = db.query(Trade).order_by(Trade.executed_at.desc()).limit(limit).all()
-
-            result = []
-            for trade in trades:
-                result.append({
-                    'timestamp': trade.executed_at,
-                    'symbol': trade.symbol,
-                    'side': trade.side,
-                    'quantity': trade.quantity,
-                    'price': trade.filled_price,
-                    'value': trade.quantity * trade.filled_price,
-                    'reason': trade.notes or '',
-                })
-
-            db.close()
+            db = DashboardSession()
+            try:
+                # Core select: plain row tuples, no mapped Trade objects
+                rows = db.execute(
+                    select(
+                        Trade.filled_at, Trade.symbol, Trade.side,
+                        Trade.quantity, Trade.price, Trade.notes,
+                    )
+                    .order_by(Trade.filled_at.desc())
+                    .limit(limit)
+                ).all()
+
+                result = [
+                    {
+                        'timestamp': filled_at,
+                        'symbol': symbol,
+                        'side': side.value,
+                        'quantity': quantity,
+                        'price': price,
+                        'value': quantity * price,
+                        'reason': notes or '',
+                    }
+                    for filled_at, symbol, side, quantity, price, notes in rows
+                ]
+            finally:
+                # Returns the connection to the pool; the session itself is reused
+                db.close()
 
             if result:
                 return result
 
         except Exception as e:
-            print(f"Error getting trades from DB: {e}")
+            logger.error("failed_to_get_db_trades", error=str(e))
 
     # Fall back to backtest trades
     return _get_backtest_trades(limit)
 
 
-def _get_backtest_trades(limit: int = 20) -> List[Dict[str, Any]]:
-    """Load trades from most recent backtest file."""
+# pattern -> (expiry, data dir mtime, [(path, mtime), ...]); see _scan_backtest_files
+_GLOB_CACHE: Dict[str, tuple] = {}
+
+
+def _scan_backtest_files(pattern: str, ttl: float = 5) -> List[tuple]:
+    """
+    (path, mtime) of files in data/ matching pattern, newest first (names
+    embed a timestamp). One os.scandir pass supplies names and mtimes; the
+    result is reused for `ttl` seconds while the directory's mtime, which
+    changes when files are added or removed, stays the same.
+    """
     data_dir = Path("data")
 
-    if not data_dir.exists():
+    try:
+        dir_mtime = data_dir.stat().st_mtime
+    except OSError:
         return []
 
+    now = time.monotonic()
+    cached = _GLOB_CACHE.get(pattern)
+    if cached and now < cached[0] and cached[1] == dir_mtime:
+        return cached[2]
+
+    entries = []
+    try:
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                if fnmatchcase(entry.name, pattern) and entry.is_file():
+                    entries.append((data_dir / entry.name, entry.stat().st_mtime))
+    except OSError:
+        return []
+
+    entries.sort(key=lambda e: e[0].name, reverse=True)
+    _GLOB_CACHE[pattern] = (now + ttl, dir_mtime, entries)
+    return entries
+
+
+def _backtest_files(pattern: str) -> List[Path]:
+    """Files in data/ matching pattern, newest first."""
+    return [path for path, _ in _scan_backtest_files(pattern)]
+
+
+def _latest_backtest_file(pattern: str) -> Optional[tuple]:
+    """(path, mtime) of the newest file in data/ matching pattern, or None."""
+    entries = _scan_backtest_files(pattern)
+    return entries[0] if entries else None
+
+
+def _get_backtest_trades(limit: int = 20) -> List[Dict[str, Any]]:
+    """Load trades from most recent backtest file."""
     # Find most recent trades file
-    trade_files = sorted(data_dir.glob("backtest_trades_*.csv"), reverse=True)
+    latest = _latest_backtest_file("backtest_trades_*.csv")
 
-    if not trade_files:
+    if latest is None:
         return []
 
     try:
-        df = pd.read_csv(trade_files[0])
-        df = df.tail(limit)
+        df = _read_backtest_tail(latest[0], limit, BACKTEST_TRADE_COLUMNS)
 
-        result = []
-        for _, row in df.iterrows():
-            result.append({
-                'date': row.get('date'),
-                'symbol': row.get('symbol'),
-                'side': row.get('side'),
-                'quantity': row.get('quantity'),
-                'price': row.get('price'),
-                'value': row.get('value'),
-                'reason': row.get('reason', ''),
-            })
-
-        return result
+        # Every record carries all trade keys; missing or blank reasons become ''
+        df = df.reindex(columns=list(BACKTEST_TRADE_COLUMNS)).fillna({'reason': ''})
+        return df.to_dict(orient='records')
 
     except Exception as e:
-        print(f"Error loading backtest trades: {e}")
+        logger.error("failed_to_load_backtest_trades", error=str(e))
         return []
 
 
@@ -218,111 +532,304 @@ def get_equity_curve() -> pd.DataFrame:
             pass
 
     # Fall back to backtest equity files
-    data_dir = Path("data")
+    return _load_equity()
 
-    if not data_dir.exists():
-        return pd.DataFrame()
 
-    # Find most recent equity file
-    equity_files = sorted(data_dir.glob("backtest_equity_*.csv"), reverse=True)
+def _load_equity(columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Cached curve of the most recent equity file, restricted to `columns`
+    when given. The curve is read once per file version and shared, so
+    callers must not mutate the result.
+    """
+    version = _equity_file_version()
 
-    if not equity_files:
+    if version is None:
         return pd.DataFrame()
 
+    df = _stale_while_revalidate('equity_curve', version, lambda: _read_equity_curve(version))
+    if columns and not df.empty:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def _equity_file_version() -> Optional[tuple]:
+    """(path, mtime) of the most recent backtest equity file, or None."""
+    return _latest_backtest_file("backtest_equity_*.csv")
+
+
+def _read_equity_curve(version: tuple) -> pd.DataFrame:
+    """Load an equity curve CSV for a (path, mtime) version."""
     try:
-        df = pd.read_csv(equity_files[0])
-        df['date'] = pd.to_datetime(df['date'])
-        return df
+        return read_backtest_file(version[0], BACKTEST_CURVE_COLUMNS)
 
     except Exception as e:
-        print(f"Error loading equity curve: {e}")
+        logger.error("failed_to_load_equity_curve", error=str(e))
         return pd.DataFrame()
 
 
+def _backtest_csv_options(header: List[str], columns: Optional[tuple]) -> Dict[str, Any]:
+    """read_csv arguments that load `columns` (all if None) with explicit dtypes."""
+    usecols = [c for c in header if not columns or c in columns]
+    return dict(
+        usecols=usecols,
+        dtype={c: t for c, t in BACKTEST_CSV_DTYPES.items() if c in usecols},
+        parse_dates=['date'] if 'date' in usecols else False,
+        engine='pyarrow' if PYARROW_AVAILABLE else 'c',
+    )
+
+
+def _parse_backtest_csv(path: Path, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """Parse a backtest CSV with explicit dtypes so pandas skips type inference."""
+    header = list(pd.read_csv(path, nrows=0).columns)
+    return pd.read_csv(path, **_backtest_csv_options(header, columns))
+
+
+# Initial window for _read_backtest_tail; files up to this size are read whole
+TAIL_READ_BYTES = 64 * 1024
+
+
+def _read_backtest_tail(path: Path, rows: int, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Last `rows` rows of a backtest CSV, parsing only the end of the file.
+    The byte window starts at TAIL_READ_BYTES and doubles until it holds
+    enough rows, so memory stays proportional to `rows` rather than the
+    file size. Small files are read whole.
+    """
+    size = path.stat().st_size
+    if size <= TAIL_READ_BYTES:
+        return read_backtest_file(path, columns).tail(rows)
+
+    window = TAIL_READ_BYTES
+    with open(path, 'rb') as f:
+        header = f.readline()
+        while True:
+            start = max(len(header), size - window)
+            f.seek(start)
+            lines = f.read().split(b'\n')
+            if start > len(header):
+                # First line of the window is probably partial
+                lines = lines[1:]
+            lines = [line for line in lines if line.strip()]
+            if len(lines) >= rows or start == len(header):
+                break
+            window *= 2
+
+    chunk = header + b'\n'.join(lines[-rows:])
+    names = header.decode().strip().split(',')
+    return pd.read_csv(io.BytesIO(chunk), **_backtest_csv_options(names, columns))
+
+
+def read_backtest_file(path: Path, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Load a backtest CSV, restricted to `columns` when given.
+    When a parquet engine is installed, the first read writes a .parquet
+    sibling and later reads load just the requested columns from it; the
+    sibling is rewritten whenever the CSV is newer.
+    """
+    if not PARQUET_AVAILABLE:
+        return _parse_backtest_csv(path, columns)
+
+    parquet_path = path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+        # The sibling holds every CSV column, so skip requested ones the CSV lacks
+        if columns:
+            header = list(pd.read_csv(path, nrows=0).columns)
+            columns = tuple(c for c in columns if c in header)
+        try:
+            return pd.read_parquet(parquet_path, columns=list(columns) if columns is not None else None)
+        except Exception as e:
+            logger.warning("failed_to_read_parquet", path=str(parquet_path), error=str(e))
+
+    df = _parse_backtest_csv(path)
+    # Write atomically: the background refresh and the script thread may be
+    # reading the sibling at the same time
+    tmp_path = parquet_path.with_name(f"{parquet_path.name}.{threading.get_ident()}.tmp")
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning("failed_to_write_parquet", path=str(parquet_path), error=str(e))
+
+    if columns:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
 def get_backtest_results() -> List[Path]:
     """Get list of available backtest result files."""
-    data_dir = Path("data")
+    # Find equity files (they have the main results)
+    return _backtest_files("backtest_equity_*.csv")
 
-    if not data_dir.exists():
-        return []
 
-    # Find equity files (they have the main results)
-    equity_files = sorted(data_dir.glob("backtest_equity_*.csv"), reverse=True)
+def get_performance_metrics() -> Dict[str, Any]:
+    """
+    Performance metrics from the equity curve and recent trades.
+    Recomputed in the background only when the equity file, the trades
+    file or the trades table changes.
+    """
+    equity_version = _equity_file_version()
 
-    return equity_files
+    if equity_version is None:
+        return {}
 
+    trades_version = _latest_backtest_file("backtest_trades_*.csv")
 
-def get_performance_metrics() -> Dict[str, Any]:
-    """Calculate performance metrics from equity curve."""
-    df = get_equity_curve()
+    return _stale_while_revalidate(
+        'performance_metrics', (equity_version, trades_version, _db_trades_version()),
+        lambda: _load_performance_metrics(equity_version),
+    )
+
+
+@ttl_cache(5)
+def _db_trades_version() -> Optional[tuple]:
+    """(count, max id) of the trades table, or None without a database."""
+    if not DB_AVAILABLE:
+        return None
+
+    try:
+        db = DashboardSession()
+        try:
+            return tuple(db.execute(select(func.count(Trade.id), func.max(Trade.id))).one())
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error("failed_to_get_db_trades_version", error=str(e))
+        return None
 
+
+def _metrics_path(equity_file: Path) -> Path:
+    """Where the metrics computed for a backtest equity file are persisted."""
+    return equity_file.with_suffix('.metrics.json')
+
+
+def _load_performance_metrics(equity_version: tuple) -> Dict[str, Any]:
+    """Equity curve metrics for a backtest plus stats for the current trades."""
+    metrics = _load_equity_metrics(equity_version)
+    if not metrics:
+        return {}
+
+    return {**metrics, **_compute_trade_metrics(metrics['total_return_pct'])}
+
+
+def _load_equity_metrics(equity_version: tuple) -> Dict[str, Any]:
+    """
+    Equity curve metrics for a backtest, read from its .metrics.json when
+    that is newer than the equity file; otherwise computed and written
+    there. Only metrics derived from the equity file itself are persisted;
+    trade stats can come from the live database and are always recomputed.
+    """
+    equity_file, equity_mtime = equity_version
+    metrics_file = _metrics_path(equity_file)
+
+    try:
+        if metrics_file.exists() and metrics_file.stat().st_mtime >= equity_mtime:
+            with open(metrics_file) as f:
+                return json.load(f)
+    except Exception as e:
+        logger.warning("failed_to_read_metrics", path=str(metrics_file), error=str(e))
+
+    # Use the curve for this exact version; the cached one may still be stale
+    metrics = _compute_equity_metrics(_read_equity_curve(equity_version))
+
+    if metrics:
+        try:
+            with open(metrics_file, 'w') as f:
+                # numpy scalars aren't JSON serializable
+                json.dump({
+                    k: int(v) if isinstance(v, (int, np.integer)) else float(v)
+                    for k, v in metrics.items()
+                }, f)
+        except Exception as e:
+            logger.warning("failed_to_write_metrics", path=str(metrics_file), error=str(e))
+
+    return metrics
+
+
+def _compute_equity_metrics(df: pd.DataFrame) -> Dict[str, Any]:
+    """Calculate performance metrics from equity curve."""
     if df.empty:
         return {}
 
     try:
+        # Work on the raw array; df is the shared cached curve
+        values = df['total_value'].to_numpy(dtype=np.float64)
+
         # Basic metrics
-        start_value = df['total_value'].iloc[0]
-        end_value = df['total_value'].iloc[-1]
+        start_value = values[0]
+        end_value = values[-1]
         total_return_pct = ((end_value - start_value) / start_value) * 100
 
         # Daily returns
-        df['returns'] = df['total_value'].pct_change()
-        daily_returns = df['returns'].dropna()
+        daily_returns = np.diff(values) / values[:-1]
+        daily_returns = daily_returns[~np.isnan(daily_returns)]
+        mean_return = daily_returns.mean() if len(daily_returns) else 0.0
 
         # Sharpe ratio (annualized, assuming 252 trading days)
-        if len(daily_returns) > 1 and daily_returns.std() > 0:
-            sharpe_ratio = (daily_returns.mean() / daily_returns.std()) * (252 ** 0.5)
-        else:
-            sharpe_ratio = 0
+        std = daily_returns.std(ddof=1) if len(daily_returns) > 1 else 0.0
+        sharpe_ratio = (mean_return / std) * (252 ** 0.5) if std > 0 else 0
 
         # Sortino ratio (using downside deviation)
         negative_returns = daily_returns[daily_returns < 0]
-        if len(negative_returns) > 1 and negative_returns.std() > 0:
-            sortino_ratio = (daily_returns.mean() / negative_returns.std()) * (252 ** 0.5)
-        else:
-            sortino_ratio = 0
+        downside_std = negative_returns.std(ddof=1) if len(negative_returns) > 1 else 0.0
+        sortino_ratio = (mean_return / downside_std) * (252 ** 0.5) if downside_std > 0 else 0
 
         # Max drawdown
-        rolling_max = df['total_value'].cummax()
-        drawdown = (df['total_value'] - rolling_max) / rolling_max * 100
-        max_drawdown_pct = abs(drawdown.min())
+        rolling_max = np.fmax.accumulate(values)
+        max_drawdown_pct = abs(np.nanmin((values - rolling_max) / rolling_max) * 100)
 
+        return {
+            'total_return_pct': total_return_pct,
+            'sharpe_ratio': sharpe_ratio,
+            'sortino_ratio': sortino_ratio,
+            'max_drawdown_pct': max_drawdown_pct,
+        }
+
+    except Exception as e:
+        logger.error("failed_to_calculate_metrics", error=str(e))
+        return {}
+
+
+def _compute_trade_metrics(total_return_pct: float) -> Dict[str, Any]:
+    """Calculate trade stats from recent trades (database or trades file)."""
+    try:
         # Get trade stats from trades file
         trades = get_recent_trades(limit=1000)
         total_trades = len(trades)
         winning_trades = 0
         profit_sum = 0
         loss_sum = 0
+        completed_trades = 0
 
         # Calculate win rate from buy/sell pairs
-        # This is a simplified calculation
+        # This is a simplified calculation: the i-th sell is matched with the
+        # i-th buy (FIFO) and counted only when both are the same symbol
         if trades:
-            buy_trades = [t for t in trades if t.get('side', '').lower() == 'buy']
-            sell_trades = [t for t in trades if t.get('side', '').lower() == 'sell']
-
-            # Match trades (simplified - assumes FIFO)
-            for i, sell in enumerate(sell_trades):
-                if i < len(buy_trades):
-                    buy = buy_trades[i]
-                    if buy.get('symbol') == sell.get('symbol'):
-                        profit = (sell.get('price', 0) - buy.get('price', 0)) * buy.get('quantity', 0)
-                        if profit > 0:
-                            winning_trades += 1
-                            profit_sum += profit
-                        else:
-                            loss_sum += abs(profit)
-
-        completed_trades = min(len([t for t in trades if t.get('side', '').lower() == 'sell']),
-                               len([t for t in trades if t.get('side', '').lower() == 'buy']))
+            cols = to_columns(trades, TRADE_COLUMNS)
+            side = np.char.lower(cols['side'].astype(str))
+            is_buy, is_sell = side == 'buy', side == 'sell'
+            completed_trades = min(int(is_buy.sum()), int(is_sell.sum()))
+            n = completed_trades
+
+            symbol = cols['symbol']
+            price = np.nan_to_num(cols['price'])
+            quantity = np.nan_to_num(cols['quantity'])
+
+            same_symbol = symbol[is_buy][:n] == symbol[is_sell][:n]
+            profit = (price[is_sell][:n] - price[is_buy][:n]) * quantity[is_buy][:n]
+            profit = profit[same_symbol]
+
+            wins = profit > 0
+            winning_trades = int(wins.sum())
+            profit_sum = float(profit[wins].sum())
+            loss_sum = float(-profit[~wins].sum())
+
         win_rate_pct = (winning_trades / completed_trades * 100) if completed_trades > 0 else 0
         profit_factor = (profit_sum / loss_sum) if loss_sum > 0 else profit_sum if profit_sum > 0 else 0
         avg_trade_pct = total_return_pct / completed_trades if completed_trades > 0 else 0
 
         return {
-            'total_return_pct': total_return_pct,
-            'sharpe_ratio': sharpe_ratio,
-            'sortino_ratio': sortino_ratio,
-            'max_drawdown_pct': max_drawdown_pct,
             'win_rate_pct': win_rate_pct,
             'profit_factor': profit_factor,
             'total_trades': total_trades,
@@ -330,58 +837,65 @@ def get_performance_metrics() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error calculating metrics: {e}")
+        logger.error("failed_to_calculate_trade_metrics", error=str(e))
         return {}
 
 
 def get_daily_pnl_history(days: int = 30) -> pd.DataFrame:
     """Get daily P&L history."""
-    df = get_equity_curve()
+    df = _load_equity(BACKTEST_EQUITY_COLUMNS)
 
-    if df.empty:
+    if df.empty or 'total_value' not in df.columns:
         return pd.DataFrame()
 
-    # Calculate daily P&L
-    df['daily_pnl'] = df['total_value'].diff()
-    df['daily_pnl_pct'] = df['total_value'].pct_change() * 100
+    # Get last N days, plus the day before so the first diff is defined
+    df = df.tail(days + 1)
 
-    # Get last N days
-    df = df.tail(days)
+    # Calculate daily P&L (on a new frame; df is the shared cached curve)
+    df = df.assign(
+        daily_pnl=df['total_value'].diff(),
+        daily_pnl_pct=df['total_value'].pct_change() * 100,
+    ).tail(days)
 
     return df[['date', 'daily_pnl', 'daily_pnl_pct']]
 
 
+@ttl_cache(30)
 def get_wsb_trending() -> List[Dict[str, Any]]:
     """Get WSB trending stocks from Quiver Quant."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return []
 
     try:
-        return quiver_provider.get_top_mentioned(limit=15)
+        return providers.quiver_provider.get_top_mentioned(limit=15)
     except Exception as e:
-        print(f"Error getting WSB trending: {e}")
+        logger.error("failed_to_get_wsb_trending", error=str(e))
         return []
 
 
+@ttl_cache(30)
 def get_stocktwits_trending() -> List[Dict[str, Any]]:
     """Get StockTwits trending stocks."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return []
 
     try:
-        return stocktwits_provider.get_trending()
+        return providers.stocktwits_provider.get_trending()
     except Exception as e:
-        print(f"Error getting StockTwits trending: {e}")
+        logger.error("failed_to_get_stocktwits_trending", error=str(e))
         return []
 
 
 def get_symbol_sentiment(symbol: str) -> Dict[str, Any]:
     """Get aggregated sentiment for a symbol."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return {}
 
     try:
-        sentiment = sentiment_aggregator.get_sentiment(symbol, include_news=False)
+        sentiment = providers.sentiment_aggregator.get_sentiment(symbol, include_news=False)
         return {
             'symbol': sentiment.symbol,
             'overall_score': sentiment.overall_score,
@@ -394,112 +908,130 @@ def get_symbol_sentiment(symbol: str) -> Dict[str, Any]:
             'stocktwits_bullish_pct': sentiment.stocktwits_bullish_pct,
         }
     except Exception as e:
-        print(f"Error getting sentiment for {symbol}: {e}")
+        logger.error("failed_to_get_symbol_sentiment", symbol=symbol, error=str(e))
         return {}
 
 
+@ttl_cache(30)
 def get_market_mood() -> Dict[str, Any]:
     """Get overall market mood from sentiment sources."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return {'mood': 'Unknown', 'emoji': '❓'}
 
     try:
-        return sentiment_aggregator.get_market_mood()
+        return providers.sentiment_aggregator.get_market_mood()
     except Exception as e:
-        print(f"Error getting market mood: {e}")
+        logger.error("failed_to_get_market_mood", error=str(e))
         return {'mood': 'Unknown', 'emoji': '❓'}
 
 
 def get_news_sentiment(symbol: str) -> Dict[str, Any]:
     """Get news sentiment for a specific symbol."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return {}
 
     try:
-        return news_provider.get_news_sentiment(symbol)
+        return providers.news_provider.get_news_sentiment(symbol)
     except Exception as e:
-        print(f"Error getting news sentiment for {symbol}: {e}")
+        logger.error("failed_to_get_news_sentiment", symbol=symbol, error=str(e))
         return {}
 
 
 def get_news_headlines(symbol: str, limit: int = 5) -> List[Dict[str, Any]]:
     """Get recent news headlines for a symbol."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return []
 
     try:
-        return news_provider.get_latest_headlines(symbol, limit=limit)
+        return providers.news_provider.get_latest_headlines(symbol, limit=limit)
     except Exception as e:
-        print(f"Error getting headlines for {symbol}: {e}")
+        logger.error("failed_to_get_headlines", symbol=symbol, error=str(e))
         return []
 
 
 def get_market_news_sentiment() -> Dict[str, Any]:
     """Get overall market sentiment from news."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return {}
 
     try:
-        return news_provider.get_market_sentiment()
+        return providers.news_provider.get_market_sentiment()
     except Exception as e:
-        print(f"Error getting market news sentiment: {e}")
+        logger.error("failed_to_get_market_news_sentiment", error=str(e))
         return {}
 
 
+@ttl_cache(30)
 def get_rate_limit_status() -> Dict[str, Any]:
     """Get Alpha Vantage rate limit status."""
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return {}
 
     try:
-        return news_provider.get_rate_limit_status()
+        return providers.news_provider.get_rate_limit_status()
     except Exception as e:
-        print(f"Error getting rate limit status: {e}")
+        logger.error("failed_to_get_rate_limit_status", error=str(e))
         return {}
 
 
+# Symbols to show news sentiment for when there are no open positions
+DEFAULT_SENTIMENT_SYMBOLS = ('AAPL', 'MSFT', 'GOOGL', 'TSLA', 'NVDA')
+
+NEWS_SENTIMENT_DEFAULTS = {'sentiment_score': 0, 'article_count': 0, 'sentiment_label': 'Neutral'}
+_news_sentiment_fields = itemgetter(*NEWS_SENTIMENT_DEFAULTS)
+
+
 def get_watchlist_news_sentiment() -> List[Dict[str, Any]]:
     """
     Get news sentiment for watchlist symbols.
     Uses cached data when available to conserve API calls.
     Only fetches 1 symbol per call to spread requests over time.
     """
-    if not SENTIMENT_AVAILABLE:
+    providers = _sentiment_providers()
+    if providers is None:
         return []
 
     try:
         # Get symbols from positions or use default watchlist
         positions = get_positions()
-        symbols = [p['symbol'] for p in positions] if positions else ['AAPL', 'MSFT', 'GOOGL', 'TSLA', 'NVDA']
+        symbols = (p['symbol'] for p in positions) if positions else DEFAULT_SENTIMENT_SYMBOLS
 
         results = []
 
         # Check rate limit status
-        rate_status = news_provider.get_rate_limit_status()
+        rate_status = providers.news_provider.get_rate_limit_status()
         remaining = rate_status.get('requests_remaining', 0)
 
         # If low on requests, only return cached data
         fetch_new = remaining > 10
 
-        for symbol in symbols[:5]:  # Limit to 5 symbols
+        for symbol in islice(symbols, 5):  # Limit to 5 symbols
             # Try to get cached sentiment first (won't make API call if cached)
-            sentiment = news_provider.get_news_sentiment(symbol)
+            sentiment = providers.news_provider.get_news_sentiment(symbol)
 
-            if sentiment and 'error' not in sentiment:
-                results.append({
-                    'symbol': symbol,
-                    'sentiment_score': sentiment.get('sentiment_score', 0),
-                    'article_count': sentiment.get('article_count', 0),
-                    'sentiment_label': sentiment.get('sentiment_label', 'Neutral'),
-                })
+            if not sentiment or 'error' in sentiment:
+                continue
+
+            score, count, label = _news_sentiment_fields({**NEWS_SENTIMENT_DEFAULTS, **sentiment})
+            results.append({
+                'symbol': symbol,
+                'sentiment_score': score,
+                'article_count': count,
+                'sentiment_label': label,
+            })
 
             # Stop fetching if we've used requests and are low on quota
-            if not fetch_new and len(results) >= 1:
+            if not fetch_new:
                 break
 
         return results
     except Exception as e:
-        print(f"Error getting watchlist news sentiment: {e}")
+        logger.error("failed_to_get_watchlist_news_sentiment", error=str(e))
         return []
 
 
@@ -508,6 +1040,9 @@ def get_current_signals() -> List[Dict[str, Any]]:
     Generate current trading signals from all enabled strategies.
     Returns signals with strategy name, symbol, type, confidence, and notes.
     """
+    if not STRATEGIES_AVAILABLE:
+        return []
+
     signals = []
 
     try:
@@ -516,15 +1051,7 @@ def get_current_signals() -> List[Dict[str, Any]]:
 
         # Get owned symbols
         positions = get_positions()
-        owned_symbols = [p['symbol'] for p in positions]
-
-        # Import strategies
-        try:
-            from src.strategies.simple_momentum import SimpleMomentumStrategy
-            from src.strategies.news_momentum import NewsMomentumStrategy
-        except ImportError as e:
-            print(f"Failed to import strategies: {e}")
-            return []
+        owned_symbols = frozenset(p['symbol'] for p in positions)
 
         # Initialize strategies
         strategies = []
@@ -552,7 +1079,7 @@ def get_current_signals() -> List[Dict[str, Any]]:
                         'data': sig.data_snapshot,
                     })
             except Exception as e:
-                print(f"Error generating signals from {strategy.name}: {e}")
+                logger.error("failed_to_generate_signals", strategy=strategy.name, error=str(e))
 
         # Sort by confidence descending
         signals.sort(key=lambda x: x['confidence'], reverse=True)
@@ -560,10 +1087,25 @@ def get_current_signals() -> List[Dict[str, Any]]:
         return signals
 
     except Exception as e:
-        print(f"Error getting current signals: {e}")
+        logger.error("failed_to_get_current_signals", error=str(e))
         return []
 
 
+# Map strategy identifiers to the trade-reason keywords that identify them
+STRATEGY_KEYWORDS = {
+    'simple_momentum': ['RSI=', 'SMA', 'momentum'],
+    'news_momentum': ['news', 'sentiment', 'Bullish news', 'bearish'],
+    'dca': ['DCA', 'dollar cost'],
+    'grid': ['grid', 'Grid'],
+}
+
+# One case-insensitive alternation per strategy, compiled once
+STRATEGY_PATTERNS = {
+    name: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for name, keywords in STRATEGY_KEYWORDS.items()
+}
+
+
 def get_strategy_performance() -> Dict[str, Dict[str, Any]]:
     """
     Calculate performance metrics broken down by strategy.
@@ -574,17 +1116,9 @@ def get_strategy_performance() -> Dict[str, Dict[str, Any]]:
     if not trades:
         return {}
 
-    # Map strategy identifiers to names
-    strategy_map = {
-        'simple_momentum': ['RSI=', 'SMA', 'momentum'],
-        'news_momentum': ['news', 'sentiment', 'Bullish news', 'bearish'],
-        'dca': ['DCA', 'dollar cost'],
-        'grid': ['grid', 'Grid'],
-    }
-
     # Initialize strategy stats
     stats = {}
-    for strat in strategy_map.keys():
+    for strat in STRATEGY_PATTERNS:
         stats[strat] = {
             'trades': 0,
             'buys': 0,
@@ -604,23 +1138,17 @@ def get_strategy_performance() -> Dict[str, Dict[str, Any]]:
 
     # Categorize trades
     for trade in trades:
-        reason = trade.get('reason', '').lower()
+        reason = trade.get('reason', '')
         side = trade.get('side', '').lower()
         symbol = trade.get('symbol', '')
         value = trade.get('value', 0) or 0
 
-        # Determine strategy
-        found_strategy = None
-        for strat_name, keywords in strategy_map.items():
-            for keyword in keywords:
-                if keyword.lower() in reason:
-                    found_strategy = strat_name
-                    break
-            if found_strategy:
-                break
-
-        if not found_strategy:
-            found_strategy = 'other'
+        # Determine strategy (first match wins, in STRATEGY_KEYWORDS order);
+        # trades without a reason can't match any keyword
+        found_strategy = next(
+            (name for name, pattern in STRATEGY_PATTERNS.items() if pattern.search(reason)),
+            'other',
+        ) if reason else 'other'
 
         # Update stats
         stats[found_strategy]['trades'] += 1
@@ -731,39 +1259,72 @@ def get_risk_metrics() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Error calculating risk metrics: {e}")
+        logger.error("failed_to_calculate_risk_metrics", error=str(e))
+        return {}
+
+
+def _get_watchlist_bars(symbols: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Last 50 daily bars per symbol from one batched request, or {} on error."""
+    try:
+        return alpaca_client.get_bars_multi(symbols, timeframe="1Day", limit=50)
+    except Exception as e:
+        logger.error("failed_to_get_watchlist_bars", error=str(e))
         return {}
 
 
-def get_watchlist_data() -> List[Dict[str, Any]]:
+# Watchlist prices/indicators are recomputed in the background at most this often
+WATCHLIST_REFRESH_SECONDS = 30
+
+
+def get_watchlist_data(force_refresh: bool = False) -> List[Dict[str, Any]]:
     """
     Get current prices, indicators, and signals for watchlist symbols.
-    Returns data for displaying a live watchlist table.
+    Returns data for displaying a live watchlist table. Served from a
+    shared snapshot that a background thread refreshes once it is older
+    than WATCHLIST_REFRESH_SECONDS; a snapshot older than two periods is
+    never served and is recomputed inline instead. Don't mutate the result.
+
+    Args:
+        force_refresh: Recompute now (e.g. on an explicit user refresh)
     """
-    if not ALPACA_AVAILABLE:
+    if not ALPACA_AVAILABLE or not INDICATORS_AVAILABLE:
         return []
 
+    bucket = int(time.monotonic() // WATCHLIST_REFRESH_SECONDS)
+    cached = _SWR_CACHE.get('watchlist')
+
+    if force_refresh or cached is None or cached[0] < bucket - 1:
+        value = _compute_watchlist_data()
+        _SWR_CACHE['watchlist'] = (bucket, value)
+        return value
+
+    return _stale_while_revalidate('watchlist', bucket, _compute_watchlist_data)
+
+
+def _compute_watchlist_data() -> List[Dict[str, Any]]:
+    """Fetch bars and compute indicators and signals for the watchlist."""
     try:
         # Get watchlist symbols
         watchlist = settings.get_watchlist_stocks()[:10]  # Limit to 10
 
-        # Get owned symbols for context
-        positions = get_positions()
-        owned_symbols = {p['symbol'] for p in positions}
+        # Fetch all symbols' bars in one request, alongside owned positions for context
+        fetched = load_concurrently(
+            positions=get_positions,
+            bars=partial(_get_watchlist_bars, watchlist),
+        )
+        owned_symbols = {p['symbol'] for p in fetched['positions']}
+        bars_by_symbol = fetched['bars']
 
         results = []
 
         for symbol in watchlist:
             try:
-                # Get bars and calculate indicators
-                bars = alpaca_client.get_bars(symbol, timeframe="1Day", limit=50)
+                # Calculate indicators from the prefetched bars
+                bars = bars_by_symbol.get(symbol, [])
 
                 if not bars or len(bars) < 20:
                     continue
 
-                # Import indicator functions
-                from src.data.indicators import calculate_all_indicators, get_latest_indicators
-
                 df = calculate_all_indicators(bars)
                 indicators = get_latest_indicators(df)
 
@@ -805,11 +1366,11 @@ def get_watchlist_data() -> List[Dict[str, Any]]:
                 })
 
             except Exception as e:
-                print(f"Error getting data for {symbol}: {e}")
+                logger.error("failed_to_get_watchlist_symbol", symbol=symbol, error=str(e))
                 continue
 
         return results
 
     except Exception as e:
-        print(f"Error getting watchlist data: {e}")
+        logger.error("failed_to_get_watchlist_data", error=str(e))
         return []
@@ -1,15 +1,25 @@
 """
-Technical indicators calculation using ta library.
-Provides common indicators for trading strategies.
+Technical indicators calculation.
+Provides common indicators for trading strategies; the math runs on numpy
+arrays in src.data._kernels.
 """
 
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 import structlog
 
+from src.data import _kernels
+
 logger = structlog.get_logger(__name__)
 
 
+def _values(series: pd.Series) -> np.ndarray:
+    """Column values as a float64 array (no copy when already float64)."""
+    return series.to_numpy(dtype=np.float64)
+
+
 def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     """
     Calculate Relative Strength Index (RSI).
@@ -21,18 +31,7 @@ def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         Series of RSI values
     """
-    # Calculate price changes
-    delta = prices.diff()
-
-    # Separate gains and losses
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-    # Calculate RS and RSI
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-
-    return rsi
+    return pd.Series(_kernels.rsi(_values(prices), period), index=prices.index, name=prices.name)
 
 
 def calculate_sma(prices: pd.Series, period: int = 20) -> pd.Series:
@@ -46,7 +45,7 @@ def calculate_sma(prices: pd.Series, period: int = 20) -> pd.Series:
     Returns:
         Series of SMA values
     """
-    return prices.rolling(window=period).mean()
+    return pd.Series(_kernels.rolling_mean(_values(prices), period), index=prices.index, name=prices.name)
 
 
 def calculate_ema(prices: pd.Series, period: int = 20) -> pd.Series:
@@ -60,7 +59,7 @@ def calculate_ema(prices: pd.Series, period: int = 20) -> pd.Series:
     Returns:
         Series of EMA values
     """
-    return prices.ewm(span=period, adjust=False).mean()
+    return pd.Series(_kernels.ema(_values(prices), period), index=prices.index, name=prices.name)
 
 
 def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
@@ -76,18 +75,13 @@ def calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: in
     Returns:
         DataFrame with MACD, signal, and histogram columns
     """
-    ema_fast = calculate_ema(prices, fast)
-    ema_slow = calculate_ema(prices, slow)
-
-    macd_line = ema_fast - ema_slow
-    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    histogram = macd_line - signal_line
+    macd_line, signal_line, histogram = _kernels.macd(_values(prices), fast, slow, signal)
 
     return pd.DataFrame({
         f'MACD_{fast}_{slow}_{signal}': macd_line,
         f'MACDs_{fast}_{slow}_{signal}': signal_line,
         f'MACDh_{fast}_{slow}_{signal}': histogram
-    })
+    }, index=prices.index)
 
 
 def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std: float = 2.0) -> pd.DataFrame:
@@ -102,17 +96,13 @@ def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std: float =
     Returns:
         DataFrame with upper, middle, and lower bands
     """
-    middle = calculate_sma(prices, period)
-    std_dev = prices.rolling(window=period).std()
-
-    upper = middle + (std_dev * std)
-    lower = middle - (std_dev * std)
+    upper, middle, lower = _kernels.bollinger_bands(_values(prices), period, std)
 
     return pd.DataFrame({
         f'BBU_{period}_{std}': upper,
         f'BBM_{period}_{std}': middle,
         f'BBL_{period}_{std}': lower
-    })
+    }, index=prices.index)
 
 
 def calculate_vwap(df: pd.DataFrame) -> pd.Series:
@@ -125,9 +115,8 @@ def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     Returns:
         Series of VWAP values
     """
-    typical_price = (df['high'] + df['low'] + df['close']) / 3
-    vwap = (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
-    return vwap
+    vwap = _kernels.vwap(_values(df['high']), _values(df['low']), _values(df['close']), _values(df['volume']))
+    return pd.Series(vwap, index=df.index)
 
 
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -141,14 +130,8 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series of ATR values
     """
-    high_low = df['high'] - df['low']
-    high_close = (df['high'] - df['close'].shift()).abs()
-    low_close = (df['low'] - df['close'].shift()).abs()
-
-    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
-
-    return atr
+    atr = _kernels.atr(_values(df['high']), _values(df['low']), _values(df['close']), period)
+    return pd.Series(atr, index=df.index)
 
 
 def calculate_stochastic(df: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> pd.DataFrame:
@@ -163,16 +146,23 @@ def calculate_stochastic(df: pd.DataFrame, k_period: int = 14, d_period: int = 3
     Returns:
         DataFrame with %K and %D values
     """
-    low_min = df['low'].rolling(window=k_period).min()
-    high_max = df['high'].rolling(window=k_period).max()
-
-    k = 100 * ((df['close'] - low_min) / (high_max - low_min))
-    d = k.rolling(window=d_period).mean()
+    k, d = _kernels.stochastic(
+        _values(df['high']), _values(df['low']), _values(df['close']), k_period, d_period
+    )
 
     return pd.DataFrame({
         f'STOCHk_{k_period}_{d_period}': k,
         f'STOCHd_{k_period}_{d_period}': d
-    })
+    }, index=df.index)
+
+
+# Columns calculate_all_indicators adds, in the order of _kernels.all_indicators
+ALL_INDICATOR_COLUMNS = (
+    'rsi', 'sma_20', 'sma_50', 'ema_12', 'ema_26',
+    'MACD_12_26_9', 'MACDs_12_26_9', 'MACDh_12_26_9',
+    'BBU_20_2.0', 'BBM_20_2.0', 'BBL_20_2.0',
+    'atr', 'vwap',
+)
 
 
 def calculate_all_indicators(bars: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -193,29 +183,17 @@ def calculate_all_indicators(bars: List[Dict[str, Any]]) -> pd.DataFrame:
             logger.warning("empty_bars_data")
             return df
 
-        # Calculate indicators
-        df['rsi'] = calculate_rsi(df['close'])
-        df['sma_20'] = calculate_sma(df['close'], 20)
-        df['sma_50'] = calculate_sma(df['close'], 50)
-        df['ema_12'] = calculate_ema(df['close'], 12)
-        df['ema_26'] = calculate_ema(df['close'], 26)
-
-        # MACD
-        macd = calculate_macd(df['close'])
-        if macd is not None and not macd.empty:
-            df = pd.concat([df, macd], axis=1)
-
-        # Bollinger Bands
-        bbands = calculate_bollinger_bands(df['close'])
-        if bbands is not None and not bbands.empty:
-            df = pd.concat([df, bbands], axis=1)
-
-        # ATR
-        df['atr'] = calculate_atr(df)
+        # Calculate every indicator in one pass over the OHLCV arrays
+        # (VWAP only if we have volume)
+        has_volume = 'volume' in df.columns
+        values = _kernels.all_indicators(
+            _values(df['high']), _values(df['low']), _values(df['close']),
+            _values(df['volume']) if has_volume else None,
+        )
+        columns = ALL_INDICATOR_COLUMNS if has_volume else ALL_INDICATOR_COLUMNS[:-1]
 
-        # VWAP (if we have volume)
-        if 'volume' in df.columns:
-            df['vwap'] = calculate_vwap(df)
+        # Attach them as a single block
+        df = pd.concat([df, pd.DataFrame(values, index=df.index, columns=columns)], axis=1)
 
         logger.debug(
             "indicators_calculated",
@@ -230,6 +208,57 @@ def calculate_all_indicators(bars: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame(bars)
 
 
+# Output key -> source column for get_latest_indicators, in output order
+_LATEST_COLUMNS = {
+    # Price data
+    "open": 'open',
+    "high": 'high',
+    "low": 'low',
+    "close": 'close',
+    "volume": 'volume',
+    # Technical indicators
+    "rsi": 'rsi',
+    "sma_20": 'sma_20',
+    "sma_50": 'sma_50',
+    "ema_12": 'ema_12',
+    "ema_26": 'ema_26',
+    "macd": 'MACD_12_26_9',
+    "macd_signal": 'MACDs_12_26_9',
+    "macd_hist": 'MACDh_12_26_9',
+    "bb_upper": 'BBU_20_2.0',
+    "bb_middle": 'BBM_20_2.0',
+    "bb_lower": 'BBL_20_2.0',
+    "atr": 'atr',
+    "vwap": 'vwap',
+}
+_LATEST_KEYS = tuple(_LATEST_COLUMNS)
+_LATEST_INDEX = pd.Index(_LATEST_COLUMNS.values())
+
+
+def calculate_all_indicators_batch(
+    bars_by_symbol: Dict[str, List[Dict[str, Any]]],
+    max_workers: Optional[int] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Calculate all common indicators for several symbols concurrently.
+    Symbols are independent and the kernels spend their time in numpy,
+    which releases the GIL, so they run on a thread pool.
+
+    Args:
+        bars_by_symbol: Dict of symbol -> list of bar data dicts
+        max_workers: Thread pool size (default: executor default)
+
+    Returns:
+        Dict of symbol -> DataFrame with all indicators calculated
+    """
+    if len(bars_by_symbol) <= 1:
+        return {symbol: calculate_all_indicators(bars) for symbol, bars in bars_by_symbol.items()}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = executor.map(calculate_all_indicators, bars_by_symbol.values())
+        return dict(zip(bars_by_symbol, frames))
+
+
 def get_latest_indicators(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Get the latest indicator values from a DataFrame.
@@ -243,33 +272,23 @@ def get_latest_indicators(df: pd.DataFrame) -> Dict[str, Any]:
     if df.empty:
         return {}
 
-    latest = df.iloc[-1]
+    # One float row in _LATEST_COLUMNS order; absent columns come back as NaN
+    row = df.iloc[-1].reindex(_LATEST_INDEX).to_numpy(dtype=np.float64)
+    present = ~np.isnan(row)
+
+    latest = {key: float(value) if ok else None for key, value, ok in zip(_LATEST_KEYS, row, present)}
+
+    # Close is always reported as a float (0.0 when the column is missing)
+    if 'close' not in df.columns:
+        latest['close'] = 0.0
+    elif latest['close'] is None:
+        latest['close'] = float('nan')
 
     # Calculate volume SMA if we have enough data
     volume_sma = None
     if 'volume' in df.columns and len(df) >= 20:
-        volume_sma = float(df['volume'].tail(20).mean())
-
-    return {
-        # Price data
-        "open": float(latest.get('open', 0)) if pd.notna(latest.get('open')) else None,
-        "high": float(latest.get('high', 0)) if pd.notna(latest.get('high')) else None,
-        "low": float(latest.get('low', 0)) if pd.notna(latest.get('low')) else None,
-        "close": float(latest.get('close', 0)),
-        "volume": float(latest.get('volume', 0)) if pd.notna(latest.get('volume')) else None,
-        "volume_sma": volume_sma,
-        # Technical indicators
-        "rsi": float(latest.get('rsi', 0)) if pd.notna(latest.get('rsi')) else None,
-        "sma_20": float(latest.get('sma_20', 0)) if pd.notna(latest.get('sma_20')) else None,
-        "sma_50": float(latest.get('sma_50', 0)) if pd.notna(latest.get('sma_50')) else None,
-        "ema_12": float(latest.get('ema_12', 0)) if pd.notna(latest.get('ema_12')) else None,
-        "ema_26": float(latest.get('ema_26', 0)) if pd.notna(latest.get('ema_26')) else None,
-        "macd": float(latest.get('MACD_12_26_9', 0)) if pd.notna(latest.get('MACD_12_26_9')) else None,
-        "macd_signal": float(latest.get('MACDs_12_26_9', 0)) if pd.notna(latest.get('MACDs_12_26_9')) else None,
-        "macd_hist": float(latest.get('MACDh_12_26_9', 0)) if pd.notna(latest.get('MACDh_12_26_9')) else None,
-        "bb_upper": float(latest.get('BBU_20_2.0', 0)) if pd.notna(latest.get('BBU_20_2.0')) else None,
-        "bb_middle": float(latest.get('BBM_20_2.0', 0)) if pd.notna(latest.get('BBM_20_2.0')) else None,
-        "bb_lower": float(latest.get('BBL_20_2.0', 0)) if pd.notna(latest.get('BBL_20_2.0')) else None,
-        "atr": float(latest.get('atr', 0)) if pd.notna(latest.get('atr')) else None,
-        "vwap": float(latest.get('vwap', 0)) if pd.notna(latest.get('vwap')) else None,
-    }
+        volume_sma = float(np.nanmean(_values(df['volume'])[-20:]))
+    latest['volume_sma'] = volume_sma
+
+    return latest
+
@@ -5,8 +5,18 @@ VADER is specifically attuned to social media sentiment.
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
+from itertools import compress
+from pathlib import Path
+import heapq
+import json
+import os
+import threading
+import time
+import numpy as np
 import structlog
 
 try:
@@ -21,6 +31,26 @@ from src.api.reddit_client import reddit_client
 logger = structlog.get_logger(__name__)
 
 
+# Distinct texts whose VADER scores are kept per analyzer
+TEXT_SCORE_CACHE_SIZE = 8192
+
+# Storage file so a restart within the TTL skips the Reddit refresh
+SENTIMENT_CACHE_FILE = Path("data/sentiment_cache.json")
+
+# Compound score buckets for signal descriptions. Bullish buckets include
+# their lower bound, bearish buckets their upper bound.
+SENTIMENT_THRESHOLDS = (-0.5, -0.2, -0.05, 0.05, 0.2, 0.5)
+SENTIMENT_DESCRIPTIONS = (
+    "Very bearish sentiment ({bearish_pct:.0f}% negative, {mentions} mentions)",
+    "Bearish sentiment ({bearish_pct:.0f}% negative, {mentions} mentions)",
+    "Slightly bearish ({bearish_pct:.0f}% negative, {mentions} mentions)",
+    "Neutral sentiment ({mentions} mentions)",
+    "Slightly bullish ({bullish_pct:.0f}% positive, {mentions} mentions)",
+    "Bullish sentiment ({bullish_pct:.0f}% positive, {mentions} mentions)",
+    "Very bullish sentiment ({bullish_pct:.0f}% positive, {mentions} mentions)",
+)
+
+
 class SentimentAnalyzer:
     """
     Analyzes sentiment from text using VADER.
@@ -29,12 +59,52 @@ class SentimentAnalyzer:
 
     def __init__(self):
         self._analyzer = None
+        self._polarity_scores = None
         self._initialized = False
 
         # Cache for sentiment data
         self._sentiment_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_timestamp: Optional[datetime] = None
+        self._cache_timestamp: Optional[datetime] = None  # For display
+        self._cache_deadline = 0.0  # time.monotonic() at which the cache expires
         self._cache_ttl_minutes = settings.sentiment_refresh_minutes
+        self._load_cache()
+
+    def _load_cache(self) -> None:
+        """Load sentiment data saved by a previous run if it is still fresh."""
+        try:
+            if SENTIMENT_CACHE_FILE.exists():
+                with open(SENTIMENT_CACHE_FILE, 'r') as f:
+                    state = json.load(f)
+                timestamp = datetime.fromisoformat(state['timestamp'])
+                remaining = timedelta(minutes=self._cache_ttl_minutes) - (datetime.utcnow() - timestamp)
+                if remaining > timedelta(0):
+                    self._sentiment_cache = state['data']
+                    self._cache_timestamp = timestamp
+                    self._cache_deadline = time.monotonic() + remaining.total_seconds()
+        except Exception as e:
+            logger.warning("sentiment_cache_load_failed", error=str(e))
+
+    def _save_cache(self) -> None:
+        """Save the sentiment cache to file in the background."""
+        state = {
+            'timestamp': self._cache_timestamp.isoformat(),
+            'data': self._sentiment_cache
+        }
+        threading.Thread(target=self._write_cache, args=(state,), daemon=True).start()
+
+    @staticmethod
+    def _write_cache(state: Dict[str, Any]) -> None:
+        """Write cache state atomically so readers never see a partial file."""
+        try:
+            SENTIMENT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = SENTIMENT_CACHE_FILE.with_name(
+                f"{SENTIMENT_CACHE_FILE.name}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_file, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_file, SENTIMENT_CACHE_FILE)
+        except Exception as e:
+            logger.warning("sentiment_cache_save_failed", error=str(e))
 
     def _initialize(self) -> bool:
         """Initialize VADER analyzer."""
@@ -50,6 +120,10 @@ class SentimentAnalyzer:
 
         try:
             self._analyzer = SentimentIntensityAnalyzer()
+            # Crossposts and repeated titles score the same text many times
+            self._polarity_scores = lru_cache(maxsize=TEXT_SCORE_CACHE_SIZE)(
+                self._analyzer.polarity_scores
+            )
             self._initialized = True
             logger.info("sentiment_analyzer_initialized")
             return True
@@ -83,12 +157,17 @@ class SentimentAnalyzer:
             return {'neg': 0, 'neu': 1, 'pos': 0, 'compound': 0}
 
         try:
-            scores = self._analyzer.polarity_scores(text)
-            return scores
+            # Copy so callers can't modify the cached scores
+            return dict(self._polarity_scores(text))
         except Exception as e:
             logger.error("sentiment_analysis_failed", error=str(e))
             return {'neg': 0, 'neu': 1, 'pos': 0, 'compound': 0}
 
+    @staticmethod
+    def _post_text(post: Dict[str, Any]) -> str:
+        """Text of a post that gets scored: title plus body."""
+        return f"{post.get('title', '')} {post.get('selftext', '')}"
+
     def analyze_posts(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze sentiment across multiple posts.
@@ -108,32 +187,36 @@ class SentimentAnalyzer:
                 'neutral_pct': 0
             }
 
-        compounds = []
-        positive = 0
-        negative = 0
-        neutral = 0
+        compounds = np.fromiter(
+            (self.analyze_text(self._post_text(post))['compound'] for post in posts),
+            dtype=np.float64,
+            count=len(posts)
+        )
+        return self._aggregate_compounds(compounds)
 
-        for post in posts:
-            text = f"{post.get('title', '')} {post.get('selftext', '')}"
-            scores = self.analyze_text(text)
+    @staticmethod
+    def _aggregate_compounds(compounds: np.ndarray) -> Dict[str, Any]:
+        """
+        Aggregate per-post compound scores into analyze_posts' result.
 
-            compounds.append(scores['compound'])
+        Args:
+            compounds: Non-empty array of compound scores
 
-            # Classify based on compound score
-            if scores['compound'] >= 0.05:
-                positive += 1
-            elif scores['compound'] <= -0.05:
-                negative += 1
-            else:
-                neutral += 1
+        Returns:
+            Aggregated sentiment data
+        """
+        # Classify based on compound score
+        count = len(compounds)
+        positive = int(np.count_nonzero(compounds >= 0.05))
+        negative = int(np.count_nonzero(compounds <= -0.05))
+        neutral = count - positive - negative
 
-        count = len(posts)
         return {
             'count': count,
-            'avg_compound': sum(compounds) / count if count > 0 else 0,
-            'positive_pct': (positive / count * 100) if count > 0 else 0,
-            'negative_pct': (negative / count * 100) if count > 0 else 0,
-            'neutral_pct': (neutral / count * 100) if count > 0 else 0,
+            'avg_compound': float(compounds.mean()),
+            'positive_pct': positive / count * 100,
+            'negative_pct': negative / count * 100,
+            'neutral_pct': neutral / count * 100,
             'positive_count': positive,
             'negative_count': negative,
             'neutral_count': neutral
@@ -142,7 +225,8 @@ class SentimentAnalyzer:
     def get_ticker_sentiment(
         self,
         ticker: str,
-        posts: List[Dict[str, Any]]
+        posts: List[Dict[str, Any]],
+        scores: Optional[np.ndarray] = None
     ) -> Dict[str, Any]:
         """
         Get sentiment for a specific ticker from posts mentioning it.
@@ -150,15 +234,19 @@ class SentimentAnalyzer:
         Args:
             ticker: Stock ticker symbol
             posts: List of posts (with 'tickers' field)
+            scores: Precomputed compound scores aligned with posts
+                (default: score the ticker's posts here)
 
         Returns:
             Sentiment data for the ticker
         """
         # Filter posts mentioning this ticker
-        ticker_posts = [
-            p for p in posts
-            if ticker in p.get('tickers', [])
-        ]
+        mentioned = np.fromiter(
+            (ticker in p.get('tickers', []) for p in posts),
+            dtype=bool,
+            count=len(posts)
+        )
+        ticker_posts = list(compress(posts, mentioned))
 
         if not ticker_posts:
             return {
@@ -169,7 +257,10 @@ class SentimentAnalyzer:
                 'bullish_pct': 0
             }
 
-        sentiment = self.analyze_posts(ticker_posts)
+        if scores is None:
+            sentiment = self.analyze_posts(ticker_posts)
+        else:
+            sentiment = self._aggregate_compounds(np.asarray(scores, dtype=np.float64)[mentioned])
 
         return {
             'symbol': ticker,
@@ -184,11 +275,7 @@ class SentimentAnalyzer:
 
     def _is_cache_valid(self) -> bool:
         """Check if sentiment cache is still valid."""
-        if not self._cache_timestamp or not self._sentiment_cache:
-            return False
-
-        cache_age = datetime.utcnow() - self._cache_timestamp
-        return cache_age < timedelta(minutes=self._cache_ttl_minutes)
+        return bool(self._sentiment_cache) and time.monotonic() < self._cache_deadline
 
     def get_reddit_sentiment(
         self,
@@ -223,7 +310,8 @@ class SentimentAnalyzer:
         try:
             logger.info("refreshing_reddit_sentiment")
 
-            # Get posts from all configured subreddits
+            # Get posts from all configured subreddits. Fetched one at a time:
+            # they share one praw.Reddit instance, which isn't thread-safe
             all_posts = []
             for subreddit in settings.get_reddit_subreddits():
                 posts = reddit_client.get_subreddit_posts(
@@ -233,21 +321,34 @@ class SentimentAnalyzer:
                 )
                 all_posts.extend(posts)
 
-            # Extract all unique tickers
-            all_tickers = set()
-            for post in all_posts:
-                all_tickers.update(post.get('tickers', []))
+            # Score every post once
+            compounds = np.fromiter(
+                (self.analyze_text(self._post_text(post))['compound'] for post in all_posts),
+                dtype=np.float64,
+                count=len(all_posts)
+            )
 
-            # Calculate sentiment for each ticker
-            sentiment_data = {}
-            for ticker in all_tickers:
-                ticker_sentiment = self.get_ticker_sentiment(ticker, all_posts)
-                if ticker_sentiment['mentions'] > 0:
-                    sentiment_data[ticker] = ticker_sentiment
+            # Index posts by the tickers they mention in one pass
+            post_ids_by_ticker = defaultdict(list)
+            for i, post in enumerate(all_posts):
+                for ticker in set(post.get('tickers', ())):
+                    post_ids_by_ticker[ticker].append(i)
+
+            # Calculate sentiment for each ticker from its posts' scores
+            sentiment_data = {
+                ticker: self.get_ticker_sentiment(
+                    ticker,
+                    [all_posts[i] for i in post_ids],
+                    compounds[post_ids]
+                )
+                for ticker, post_ids in post_ids_by_ticker.items()
+            }
 
             # Update cache
             self._sentiment_cache = sentiment_data
             self._cache_timestamp = datetime.utcnow()
+            self._cache_deadline = time.monotonic() + self._cache_ttl_minutes * 60
+            self._save_cache()
 
             logger.info(
                 "reddit_sentiment_refreshed",
@@ -284,23 +385,11 @@ class SentimentAnalyzer:
             or data['mentions'] >= settings.wsb_mention_threshold
         }
 
-        # Sort by various metrics
-        by_mentions = sorted(
-            wsb_data.items(),
-            key=lambda x: x[1]['mentions'],
-            reverse=True
-        )
-
-        by_bullish = sorted(
-            wsb_data.items(),
-            key=lambda x: x[1]['avg_compound'],
-            reverse=True
-        )
-
-        by_bearish = sorted(
-            wsb_data.items(),
-            key=lambda x: x[1]['avg_compound']
-        )
+        # Sort by sentiment once; bullish and bearish are its two ends
+        by_mentions = heapq.nlargest(10, wsb_data.items(), key=lambda x: x[1]['mentions'])
+        by_compound = sorted(wsb_data.items(), key=lambda x: x[1]['avg_compound'])
+        by_bullish = by_compound[:-6:-1]
+        by_bearish = by_compound[:5]
 
         return {
             'available': True,
@@ -308,16 +397,16 @@ class SentimentAnalyzer:
             'total_tickers': len(wsb_data),
             'most_mentioned': [
                 {'symbol': t, 'mentions': d['mentions'], 'sentiment': d['avg_compound']}
-                for t, d in by_mentions[:10]
+                for t, d in by_mentions
             ],
             'most_bullish': [
                 {'symbol': t, 'sentiment': d['avg_compound'], 'mentions': d['mentions']}
-                for t, d in by_bullish[:5]
+                for t, d in by_bullish
                 if d['avg_compound'] > 0.1 and d['mentions'] >= 3
             ],
             'most_bearish': [
                 {'symbol': t, 'sentiment': d['avg_compound'], 'mentions': d['mentions']}
-                for t, d in by_bearish[:5]
+                for t, d in by_bearish
                 if d['avg_compound'] < -0.1 and d['mentions'] >= 3
             ]
         }
@@ -353,20 +442,12 @@ class SentimentAnalyzer:
             return (0.0, f"Insufficient mentions ({mentions} < {min_mentions})")
 
         # Generate description
-        if compound >= 0.5:
-            desc = f"Very bullish sentiment ({bullish_pct:.0f}% positive, {mentions} mentions)"
-        elif compound >= 0.2:
-            desc = f"Bullish sentiment ({bullish_pct:.0f}% positive, {mentions} mentions)"
-        elif compound >= 0.05:
-            desc = f"Slightly bullish ({bullish_pct:.0f}% positive, {mentions} mentions)"
-        elif compound <= -0.5:
-            desc = f"Very bearish sentiment ({data['bearish_pct']:.0f}% negative, {mentions} mentions)"
-        elif compound <= -0.2:
-            desc = f"Bearish sentiment ({data['bearish_pct']:.0f}% negative, {mentions} mentions)"
-        elif compound <= -0.05:
-            desc = f"Slightly bearish ({data['bearish_pct']:.0f}% negative, {mentions} mentions)"
-        else:
-            desc = f"Neutral sentiment ({mentions} mentions)"
+        bucket = (bisect_right if compound >= 0 else bisect_left)(SENTIMENT_THRESHOLDS, compound)
+        desc = SENTIMENT_DESCRIPTIONS[bucket].format(
+            bullish_pct=bullish_pct,
+            bearish_pct=data['bearish_pct'],
+            mentions=mentions
+        )
 
         return (compound, desc)
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Boolean,
-    ForeignKey, JSON, Enum as SQLEnum, Text
+    ForeignKey, JSON, Enum as SQLEnum, Text, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -103,6 +103,33 @@ class Position(Base):
         return None
 
 
+class PositionStats(Base):
+    """
+    Running closed-position counters (single row).
+    Updated in the same transaction that closes a position so performance
+    summaries read constant-time counts instead of rescanning positions.
+    """
+    __tablename__ = "position_stats"
+
+    id = Column(Integer, primary_key=True)
+    closed_positions = Column(Integer, nullable=False, default=0)
+    winning_positions = Column(Integer, nullable=False, default=0)
+    realized_pnl = Column(Float, nullable=False, default=0.0)
+
+    # Metadata
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<PositionStats(closed={self.closed_positions}, winning={self.winning_positions}, pnl={self.realized_pnl:.2f})>"
+
+    @property
+    def win_rate_pct(self) -> float:
+        """Win rate across closed positions"""
+        if self.closed_positions:
+            return self.winning_positions / self.closed_positions * 100
+        return 0.0
+
+
 class Trade(Base):
     """
     Individual trade executions (buy/sell orders).
@@ -133,6 +160,18 @@ class Trade(Base):
     # Relationships
     position = relationship("Position", back_populates="trades")
 
+    # Covering index for the recent-trades query (ORDER BY filled_at DESC
+    # LIMIT n) so PostgreSQL can answer it with an index-only scan. Other
+    # backends already walk the plain filled_at index backwards, so it is
+    # only created on PostgreSQL.
+    __table_args__ = (
+        Index(
+            "ix_trades_filled_at_desc",
+            filled_at.desc(),
+            postgresql_include=["symbol", "side", "quantity", "price", "notes"],
+        ).ddl_if(dialect="postgresql"),
+    )
+
     def __repr__(self) -> str:
         return f"<Trade(id={self.id}, symbol={self.symbol}, side={self.side.value}, qty={self.quantity}, price={self.price})>"
 
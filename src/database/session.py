@@ -11,10 +11,21 @@ from src.database.models import Base
 
 
 # Create engine
+if "sqlite" in settings.database_url:
+    engine_options = {"connect_args": {"check_same_thread": False}}
+else:
+    # Server databases: keep a pool of warm connections and drop dead ones
+    # before handing them out
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+    }
+
 engine = create_engine(
     settings.database_url,
     echo=settings.log_level == "DEBUG",
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    **engine_options
 )
 
 # Create session factory
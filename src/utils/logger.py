@@ -4,9 +4,11 @@ Structured logging setup with dual log files:
 - ktrade_debug.log: JSON format, all events, full technical detail
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -300,10 +302,15 @@ class HumanLogFilter(logging.Filter):
         return True
 
 
-def setup_logging() -> structlog.BoundLogger:
+def setup_logging(queued: bool = False) -> structlog.BoundLogger:
     """
     Configure dual logging: human-readable and debug JSON logs.
 
+    Args:
+        queued: Hand records to a background listener thread that does the
+            file/console writes, so logging callers never block on I/O
+            (used by the dashboard, where loaders run on request threads)
+
     Returns:
         Configured structlog logger
     """
@@ -347,6 +354,14 @@ def setup_logging() -> structlog.BoundLogger:
     console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
     root_logger.addHandler(console_handler)
 
+    if queued:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+        root_logger.handlers = [QueueHandler(log_queue)]
+        listener.start()
+        # Flush whatever is still queued on interpreter exit
+        atexit.register(listener.stop)
+
     # Configure structlog
     structlog.configure(
         processors=[
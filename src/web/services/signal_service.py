@@ -124,9 +124,9 @@ class SignalService:
             # Get currently owned symbols from Alpaca
             try:
                 positions = alpaca_client.get_positions()
-                owned_symbols = [p.get("symbol") for p in positions if p.get("symbol")]
+                owned_symbols = frozenset(p.get("symbol") for p in positions if p.get("symbol"))
             except Exception:
-                owned_symbols = []
+                owned_symbols = frozenset()
 
             signals = []
 
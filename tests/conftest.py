@@ -0,0 +1,10 @@
+"""
+Shared test configuration.
+Settings require Alpaca credentials at import time; tests never call the
+API, so placeholders are enough when no .env is present.
+"""
+
+import os
+
+os.environ.setdefault("ALPACA_API_KEY", "test")
+os.environ.setdefault("ALPACA_SECRET_KEY", "test")
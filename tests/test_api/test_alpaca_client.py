@@ -0,0 +1,31 @@
+"""
+Tests for the Alpaca client's batched bar fetch.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.api.alpaca_client import alpaca_client
+
+
+def make_bar(day: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        timestamp=datetime(2024, 1, 1) + timedelta(days=day),
+        open=100 + day, high=101 + day, low=99 + day, close=100 + day, volume=1000,
+    )
+
+
+def test_get_bars_multi_keeps_most_recent_bars(monkeypatch):
+    response = SimpleNamespace(data={
+        'AAPL': [make_bar(day) for day in range(80)],
+        'MSFT': [make_bar(day) for day in range(10)],
+    })
+    monkeypatch.setattr(
+        alpaca_client, 'stock_data_client', SimpleNamespace(get_stock_bars=lambda request: response)
+    )
+
+    result = alpaca_client.get_bars_multi(['AAPL', 'MSFT', 'NVDA'], limit=50)
+
+    assert [bar['close'] for bar in result['AAPL']] == [100.0 + day for day in range(30, 80)]
+    assert len(result['MSFT']) == 10
+    assert result['NVDA'] == []
@@ -0,0 +1,96 @@
+"""
+Tests for the running closed-position stats.
+The stats row is updated on each close and must always match a fresh seed
+from the positions table.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core import order_executor as executor_module
+from src.core import portfolio as portfolio_module
+from src.core.order_executor import OrderExecutor
+from src.core.portfolio import PortfolioTracker
+from src.database.models import Base, Position, PositionStats, PositionStatus
+
+
+class FakeAlpacaClient:
+    """Alpaca client whose sell orders are still pending when checked."""
+
+    def __init__(self, price: float):
+        self.price = price
+
+    def get_open_orders(self):
+        return []
+
+    def get_bars(self, symbol, timeframe, limit):
+        return [{'close': self.price}]
+
+    def close_position(self, symbol):
+        return {'id': 'order-1'}
+
+    def get_order(self, order_id):
+        return {'filled_avg_price': None, 'filled_qty': 0}
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ktrade.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(portfolio_module, 'SessionLocal', factory)
+    yield factory
+    engine.dispose()
+
+
+def add_position(db, entry_price: float, quantity: float, exit_price: float = None) -> Position:
+    position = Position(
+        symbol='AAPL',
+        quantity=quantity,
+        entry_price=entry_price,
+        entry_date=datetime(2024, 1, 2),
+        strategy='test',
+        status=PositionStatus.OPEN,
+    )
+    if exit_price is not None:
+        position.exit_price = exit_price
+        position.status = PositionStatus.CLOSED
+    db.add(position)
+    db.commit()
+    return position
+
+
+def stats_tuple(stats: PositionStats) -> tuple:
+    return stats.closed_positions, stats.winning_positions, pytest.approx(stats.realized_pnl)
+
+
+def reseeded_stats(session_factory) -> tuple:
+    with session_factory() as db:
+        db.query(PositionStats).delete()
+        db.commit()
+    with session_factory() as db:
+        return stats_tuple(PortfolioTracker().get_position_stats(db))
+
+
+def test_unfilled_close_matches_reseed(session_factory, monkeypatch):
+    monkeypatch.setattr(executor_module, 'alpaca_client', FakeAlpacaClient(price=110.0))
+    monkeypatch.setattr('time.sleep', lambda seconds: None)
+
+    with session_factory() as db:
+        add_position(db, entry_price=50.0, quantity=4, exit_price=45.0)
+        position = add_position(db, entry_price=100.0, quantity=3)
+
+        # Seed from the one already-closed position
+        assert stats_tuple(PortfolioTracker().get_position_stats(db)) == (1, 0, pytest.approx(-20.0))
+
+        assert OrderExecutor().close_position(position, "test exit", db)
+
+    with session_factory() as db:
+        recorded = stats_tuple(db.get(PositionStats, 1))
+
+    assert recorded == (2, 1, pytest.approx(10.0))
+    assert recorded == reseeded_stats(session_factory)
+
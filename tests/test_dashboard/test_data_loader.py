@@ -0,0 +1,210 @@
+"""
+Tests for the dashboard data loader's caching and file-reading helpers.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dashboard import data_loader as dl
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    dl.clear_caches()
+    yield
+    dl.clear_caches()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the loader's TTL checks."""
+    now = [1000.0]
+    monkeypatch.setattr(dl, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def write_trades_csv(path, rows: int) -> None:
+    """Backtest trades file in the layout scripts/run_backtest.py writes."""
+    rng = np.random.default_rng(7)
+    price = rng.uniform(10, 500, rows).round(2)
+    quantity = rng.integers(1, 100, rows).astype(float)
+    pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=rows, freq='h'),
+        'symbol': rng.choice(['AAPL', 'MSFT', 'NVDA', 'TSLA'], rows),
+        'side': rng.choice(['buy', 'sell'], rows),
+        'quantity': quantity,
+        'price': price,
+        'value': quantity * price,
+        'reason': rng.choice(['RSI oversold', 'Take profit', ''], rows),
+    }).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("rows", [1, 10, 250, 1999, 2000, 5000])
+def test_read_backtest_tail_matches_full_read(tmp_path, monkeypatch, rows):
+    # A small initial window makes the reader grow it several times
+    monkeypatch.setattr(dl, 'TAIL_READ_BYTES', 1024)
+    path = tmp_path / "backtest_trades_20240101_000000.csv"
+    write_trades_csv(path, 2000)
+
+    expected = pd.read_csv(path, parse_dates=['date']).tail(rows).reset_index(drop=True)
+    actual = dl._read_backtest_tail(path, rows)
+
+    # The tail's categories only cover the rows it read
+    actual = actual.astype({'symbol': object, 'side': object})
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_read_backtest_tail_selects_columns(tmp_path, monkeypatch):
+    monkeypatch.setattr(dl, 'TAIL_READ_BYTES', 1024)
+    path = tmp_path / "backtest_trades_20240101_000000.csv"
+    write_trades_csv(path, 500)
+
+    actual = dl._read_backtest_tail(path, 20, ('date', 'price'))
+    expected = pd.read_csv(path, usecols=['date', 'price'], parse_dates=['date']).tail(20)
+
+    pd.testing.assert_frame_equal(actual, expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_lttb_keeps_short_series_whole():
+    x = np.arange(10, dtype=float)
+    np.testing.assert_array_equal(dl.lttb_indices(x, x, 10), np.arange(10))
+    np.testing.assert_array_equal(dl.lttb_indices(x, x, 50), np.arange(10))
+
+
+def test_lttb_downsamples_to_ordered_subset():
+    rng = np.random.default_rng(3)
+    x = np.arange(5000, dtype=float)
+    y = np.cumsum(rng.normal(size=5000))
+
+    indices = dl.lttb_indices(x, y, 200)
+
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == 4999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_spikes():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[[137, 612]] = [50.0, -50.0]
+
+    indices = dl.lttb_indices(x, y, 20)
+
+    assert 137 in indices and 612 in indices
+
+
+def test_ttl_cache_reuses_value_until_expiry(clock):
+    calls = []
+
+    @dl.ttl_cache(10)
+    def load_value(key):
+        calls.append(key)
+        return len(calls)
+
+    assert load_value('a') == 1
+    clock[0] += 9
+    assert load_value('a') == 1
+    assert load_value('b') == 2
+
+    clock[0] += 2
+    assert load_value('a') == 3
+    assert calls == ['a', 'b', 'a']
+
+
+def test_ttl_cache_serves_previous_value_when_refresh_fails(clock):
+    results = iter([1, RuntimeError("api down"), 2])
+
+    @dl.ttl_cache(10)
+    def load_flaky():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert load_flaky() == 1
+    clock[0] += 11
+    assert load_flaky() == 1  # failed refresh keeps the old value
+    clock[0] += 5
+    assert load_flaky() == 1  # ...for another full TTL
+    clock[0] += 6
+    assert load_flaky() == 2
+
+
+def test_ttl_cache_raises_without_previous_value(clock):
+    @dl.ttl_cache(10)
+    def load_broken():
+        raise RuntimeError("api down")
+
+    with pytest.raises(RuntimeError):
+        load_broken()
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_stale_while_revalidate_computes_first_call_inline():
+    calls = []
+    compute = lambda: calls.append(1) or 'v1'
+
+    assert dl._stale_while_revalidate('key', 1, compute) == 'v1'
+    assert dl._stale_while_revalidate('key', 1, compute) == 'v1'
+    assert len(calls) == 1
+
+
+def test_stale_while_revalidate_serves_stale_during_refresh():
+    release = threading.Event()
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        release.wait(2)
+        return 'v2'
+
+    dl._stale_while_revalidate('key', 1, lambda: 'v1')
+
+    # New version: the old value comes back at once and one refresh starts
+    assert dl._stale_while_revalidate('key', 2, slow_compute) == 'v1'
+    assert dl._stale_while_revalidate('key', 2, slow_compute) == 'v1'
+    assert wait_for(lambda: calls)
+
+    release.set()
+    assert wait_for(lambda: dl._SWR_CACHE['key'] == (2, 'v2'))
+    assert dl._stale_while_revalidate('key', 2, slow_compute) == 'v2'
+    assert len(calls) == 1
+
+
+@pytest.mark.skipif(not dl.PARQUET_AVAILABLE, reason="no parquet engine installed")
+def test_read_backtest_file_replaces_corrupt_parquet_sibling(tmp_path):
+    path = tmp_path / "backtest_trades_20240101_000000.csv"
+    write_trades_csv(path, 100)
+    parquet_path = path.with_suffix('.parquet')
+    parquet_path.write_bytes(b"torn write")
+
+    expected = pd.read_csv(path, usecols=['date', 'price'], parse_dates=['date'])
+    actual = dl.read_backtest_file(path, ('date', 'price', 'missing'))
+
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    # The sibling was rewritten whole and now serves the same columns
+    pd.testing.assert_frame_equal(dl.read_backtest_file(path, ('date', 'price')), expected, check_dtype=False)
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == '.tmp'] == []
+
+
+def test_load_concurrently_runs_nested_calls_inline():
+    inner = lambda: dl.load_concurrently(a=lambda: 1, b=threading.current_thread)
+    result = dl.load_concurrently(**{f'outer_{i}': inner for i in range(20)})
+
+    assert len(result) == 20
+    for value in result.values():
+        assert value['a'] == 1
+        assert value['b'].name.startswith(dl._LOADER_THREAD_PREFIX)
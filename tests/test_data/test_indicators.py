@@ -0,0 +1,180 @@
+"""
+Tests for the technical indicators.
+The numpy kernels (and the numba EMA when installed) are checked against
+the pandas implementations they replaced.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import _kernels
+from src.data.indicators import (
+    calculate_all_indicators,
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_ema,
+    calculate_macd,
+    calculate_rsi,
+    calculate_sma,
+    calculate_stochastic,
+    calculate_vwap,
+)
+
+
+# Reference implementations: the original pandas versions of each indicator
+
+def reference_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+    delta = prices.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    return 100 - (100 / (1 + gain / loss))
+
+
+def reference_ema(prices: pd.Series, period: int) -> pd.Series:
+    return prices.ewm(span=period, adjust=False).mean()
+
+
+def reference_macd(prices: pd.Series) -> pd.DataFrame:
+    macd_line = reference_ema(prices, 12) - reference_ema(prices, 26)
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    return pd.DataFrame({
+        'MACD_12_26_9': macd_line,
+        'MACDs_12_26_9': signal_line,
+        'MACDh_12_26_9': macd_line - signal_line,
+    })
+
+
+def reference_bollinger_bands(prices: pd.Series) -> pd.DataFrame:
+    middle = prices.rolling(window=20).mean()
+    std_dev = prices.rolling(window=20).std()
+    return pd.DataFrame({
+        'BBU_20_2.0': middle + std_dev * 2.0,
+        'BBM_20_2.0': middle,
+        'BBL_20_2.0': middle - std_dev * 2.0,
+    })
+
+
+def reference_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    high_low = df['high'] - df['low']
+    high_close = (df['high'] - df['close'].shift()).abs()
+    low_close = (df['low'] - df['close'].shift()).abs()
+    true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    return true_range.rolling(window=period).mean()
+
+
+def reference_vwap(df: pd.DataFrame) -> pd.Series:
+    typical_price = (df['high'] + df['low'] + df['close']) / 3
+    return (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
+
+
+def reference_stochastic(df: pd.DataFrame) -> pd.DataFrame:
+    low_min = df['low'].rolling(window=14).min()
+    high_max = df['high'].rolling(window=14).max()
+    k = 100 * ((df['close'] - low_min) / (high_max - low_min))
+    return pd.DataFrame({'STOCHk_14_3': k, 'STOCHd_14_3': k.rolling(window=3).mean()})
+
+
+def reference_all_indicators(bars) -> pd.DataFrame:
+    df = pd.DataFrame(bars)
+    df['rsi'] = reference_rsi(df['close'])
+    df['sma_20'] = df['close'].rolling(window=20).mean()
+    df['sma_50'] = df['close'].rolling(window=50).mean()
+    df['ema_12'] = reference_ema(df['close'], 12)
+    df['ema_26'] = reference_ema(df['close'], 26)
+    df = pd.concat([df, reference_macd(df['close']), reference_bollinger_bands(df['close'])], axis=1)
+    df['atr'] = reference_atr(df)
+    df['vwap'] = reference_vwap(df)
+    return df
+
+
+def make_bars(n: int, seed: int = 42) -> list:
+    """Fixed random-walk OHLCV bars, with a flat step and a run of gains."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    if n > 20:
+        close[3] = close[2]
+        close[5:20] = close[5] + np.arange(15)  # no losses: RS is infinite
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    volume = rng.integers(1_000, 5_000, n).astype(float)
+    return [
+        {'open': c, 'high': h, 'low': lo, 'close': c, 'volume': v}
+        for c, h, lo, v in zip(close, high, low, volume)
+    ]
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(make_bars(120))
+
+
+def test_rsi_matches_pandas(df):
+    pd.testing.assert_series_equal(calculate_rsi(df['close']), reference_rsi(df['close']), rtol=1e-9)
+
+
+def test_sma_matches_pandas(df):
+    expected = df['close'].rolling(window=20).mean()
+    pd.testing.assert_series_equal(calculate_sma(df['close'], 20), expected, rtol=1e-9)
+
+
+def test_ema_matches_pandas(df):
+    # Runs the numba kernel when numba is installed, the ewm fallback otherwise
+    pd.testing.assert_series_equal(calculate_ema(df['close'], 12), reference_ema(df['close'], 12), rtol=1e-9)
+
+
+@pytest.mark.skipif(not _kernels.NUMBA_AVAILABLE, reason="numba not installed")
+def test_numba_ema_matches_pandas(df):
+    close = df['close'].to_numpy()
+    np.testing.assert_allclose(_kernels.ema(close, 26), reference_ema(df['close'], 26).to_numpy(), rtol=1e-9)
+
+
+def with_gaps(prices: pd.Series) -> pd.Series:
+    """Leading NaNs and a few missing bars, including a run of them."""
+    gapped = prices.copy()
+    gapped.iloc[[0, 1, 7, 30, 31, 32, 90]] = np.nan
+    return gapped
+
+
+@pytest.mark.parametrize("period", [3, 9, 12, 26])
+def test_ema_with_nans_matches_pandas(df, period):
+    # The fallback is pandas' ewm itself, so this pins the numba kernel to it
+    close = with_gaps(df['close'])
+    pd.testing.assert_series_equal(calculate_ema(close, period), reference_ema(close, period), rtol=1e-9)
+    np.testing.assert_allclose(
+        _kernels.ema(close.to_numpy(), period), reference_ema(close, period).to_numpy(), rtol=1e-9
+    )
+
+
+def test_macd_with_nans_matches_pandas(df):
+    close = with_gaps(df['close'])
+    pd.testing.assert_frame_equal(calculate_macd(close), reference_macd(close), rtol=1e-9)
+
+
+def test_macd_matches_pandas(df):
+    pd.testing.assert_frame_equal(calculate_macd(df['close']), reference_macd(df['close']), rtol=1e-9)
+
+
+def test_bollinger_bands_match_pandas(df):
+    pd.testing.assert_frame_equal(
+        calculate_bollinger_bands(df['close']), reference_bollinger_bands(df['close']), rtol=1e-9
+    )
+
+
+def test_atr_matches_pandas(df):
+    pd.testing.assert_series_equal(calculate_atr(df), reference_atr(df), rtol=1e-9)
+
+
+def test_vwap_matches_pandas(df):
+    pd.testing.assert_series_equal(calculate_vwap(df), reference_vwap(df), rtol=1e-9)
+
+
+def test_stochastic_matches_pandas(df):
+    pd.testing.assert_frame_equal(calculate_stochastic(df), reference_stochastic(df), rtol=1e-9)
+
+
+@pytest.mark.parametrize("n", [5, 30, 120])
+def test_all_indicators_match_pandas(n):
+    bars = make_bars(n)
+    pd.testing.assert_frame_equal(calculate_all_indicators(bars), reference_all_indicators(bars), rtol=1e-9)
+